@@ -4,15 +4,31 @@ Accuracy Monitoring Tool for Crowd Monitoring System
 Tracks system performance and provides accuracy metrics
 """
 
+import os
 import time
 import json
+import queue
+import threading
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
 import sqlite3
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
 class AccuracyMonitor:
     """Monitor and track system accuracy metrics."""
     
+    MANUAL_COUNT_BATCH_SIZE = 10
+    
     def __init__(self):
         self.metrics_file = "data/accuracy_metrics.json"
         self.start_time = datetime.now()
@@ -22,23 +38,62 @@ class AccuracyMonitor:
             'total_crossings': 0,
             'false_positives': 0,
             'missed_detections': 0,
-            'fps_history': [],
+            'fps_history': deque(maxlen=100),
             'accuracy_history': [],
             'manual_counts': []
         }
         
+        # Persistent database handle reused across accuracy checks
+        Path("data").mkdir(exist_ok=True)
+        self._pending_manual_counts = []
+        self._conn = sqlite3.connect('data/database.db', check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA cache_size=-64000")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS manual_counts (
+                ts TEXT,
+                actual INT,
+                system INT,
+                accuracy REAL,
+                notes TEXT
+            )
+        """)
+        self._conn.commit()
+        self._count_cursor = self._conn.cursor()
+        self._index_ready = False
+        
+        # Running session count; only events after _last_event_id are re-read
+        self._last_event_id = 0
+        self._cached_count = 0
+        
+        # Rolling window for the average FPS shown in session stats
+        self._fps_window = deque(maxlen=10)
+        self._fps_sum = 0.0
+        
+        # Metrics JSON is written by a background thread off the CLI path
+        self._save_q = queue.Queue()
+        self._writer_thread = threading.Thread(target=self._metrics_writer, daemon=True)
+        self._writer_thread.start()
+        
     def log_detection(self, detection_count, fps):
         """Log detection metrics."""
         self.metrics['total_detections'] += detection_count
+        # Epoch floats are cheap per frame; ISO strings are built only when saving
         self.metrics['fps_history'].append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),
             'fps': fps,
             'detections': detection_count
         })
-        
-        # Keep only last 100 FPS readings
-        if len(self.metrics['fps_history']) > 100:
-            self.metrics['fps_history'] = self.metrics['fps_history'][-100:]
+        self._push_fps(fps)
+    
+    def _push_fps(self, fps):
+        """Add an FPS sample to the rolling window, keeping its sum current."""
+        if len(self._fps_window) == self._fps_window.maxlen:
+            self._fps_sum -= self._fps_window[0]
+        self._fps_window.append(fps)
+        self._fps_sum += fps
     
     def log_crossing(self, crossing_type, object_id):
         """Log crossing event."""
@@ -61,6 +116,9 @@ class AccuracyMonitor:
         
         self.metrics['manual_counts'].append(manual_entry)
         self.metrics['accuracy_history'].append(accuracy)
+        self._pending_manual_counts.append((
+            manual_entry['timestamp'], actual_count, current_system_count, accuracy, notes
+        ))
         
         print(f"\n📊 ACCURACY CHECK:")
         print(f"   Manual Count: {actual_count}")
@@ -68,38 +126,87 @@ class AccuracyMonitor:
         print(f"   Accuracy: {accuracy:.1f}%")
         print(f"   Notes: {notes}")
         
-        self.save_metrics()
+        if len(self._pending_manual_counts) >= self.MANUAL_COUNT_BATCH_SIZE:
+            self.flush_manual_counts()
+        self._save_q.put(self._snapshot_metrics())
         return accuracy
     
+    def flush_manual_counts(self):
+        """Write buffered manual counts to the database in one transaction."""
+        if not self._pending_manual_counts or self._conn is None:
+            return
+        try:
+            batch = self._pending_manual_counts
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO manual_counts VALUES (?, ?, ?, ?, ?)", batch
+                )
+            self._pending_manual_counts = []
+        except Exception as e:
+            print(f"Error saving manual counts: {e}")
+    
     def get_current_system_count(self):
         """Get current count from database."""
         try:
-            conn = sqlite3.connect('data/database.db')
-            cursor = conn.cursor()
+            cursor = self._count_cursor
+            
+            # Covering index lets SQLite SEARCH the session window instead of scanning
+            if not self._index_ready:
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS events_ts_type_idx ON events(timestamp, event_type)"
+                )
+                self._index_ready = True
             
-            # Get total entries minus exits
+            # Only fold in events logged since the previous check
             cursor.execute("""
-                SELECT 
-                    COALESCE(SUM(CASE WHEN event_type = 'entry' THEN 1 ELSE 0 END), 0) as entries,
-                    COALESCE(SUM(CASE WHEN event_type = 'exit' THEN 1 ELSE 0 END), 0) as exits
-                FROM events 
-                WHERE timestamp >= ?
-            """, (self.start_time.isoformat(),))
+                SELECT event_type, COUNT(*), MAX(id)
+                FROM events
+                WHERE id > ? AND timestamp >= ? AND event_type IN ('entry', 'exit')
+                GROUP BY event_type
+            """, (self._last_event_id, self.start_time.isoformat()))
             
-            result = cursor.fetchone()
-            entries, exits = result if result else (0, 0)
+            for event_type, count, max_id in cursor.fetchall():
+                if event_type == 'entry':
+                    self._cached_count += count
+                else:
+                    self._cached_count -= count
+                self._last_event_id = max(self._last_event_id, max_id)
             
-            conn.close()
-            return entries - exits
+            return self._cached_count
             
         except Exception as e:
             print(f"Error getting system count: {e}")
             return 0
     
+    def close(self):
+        """Commit pending work and close the database connection."""
+        conn = getattr(self, '_conn', None)
+        if conn is None:
+            return
+        
+        # Let the writer finish any queued snapshot before shutting down;
+        # __init__ may have failed before the writer was started
+        writer = getattr(self, '_writer_thread', None)
+        if writer is not None and writer.is_alive():
+            self._save_q.put(None)
+            writer.join()
+        
+        try:
+            self.flush_manual_counts()
+            conn.commit()
+        except Exception as e:
+            print(f"Error closing database: {e}")
+        finally:
+            conn.close()
+            self._conn = None
+    
+    def __del__(self):
+        self.close()
+    
     def get_session_stats(self):
         """Get current session statistics."""
         duration = datetime.now() - self.start_time
-        avg_fps = sum(m['fps'] for m in self.metrics['fps_history'][-10:]) / min(10, len(self.metrics['fps_history'])) if self.metrics['fps_history'] else 0
+        avg_fps = self._fps_sum / len(self._fps_window) if self._fps_window else 0
         
         stats = {
             'session_duration': str(duration).split('.')[0],  # Remove microseconds
@@ -135,11 +242,53 @@ class AccuracyMonitor:
         print("="*50)
     
     def save_metrics(self):
+        """Queue a metrics snapshot for the background writer."""
+        self.flush_manual_counts()
+        self._save_q.put(self._snapshot_metrics())
+    
+    def _snapshot_metrics(self):
+        """Copy metrics so later appends don't race the writer thread."""
+        return dict(
+            self.metrics,
+            fps_history=[
+                dict(m, timestamp=datetime.fromtimestamp(m['timestamp']).isoformat())
+                for m in self.metrics['fps_history']
+            ],
+            accuracy_history=list(self.metrics['accuracy_history']),
+            manual_counts=list(self.metrics['manual_counts'])
+        )
+    
+    def _metrics_writer(self):
+        """Write queued snapshots, coalescing any backlog into the newest one."""
+        while True:
+            metrics = self._save_q.get()
+            stop = metrics is None
+            
+            while not stop:
+                try:
+                    pending = self._save_q.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                else:
+                    metrics = pending
+            
+            if metrics is not None:
+                self._write_metrics(metrics)
+            if stop:
+                return
+    
+    def _write_metrics(self, metrics):
         """Save metrics to file."""
         try:
             Path("data").mkdir(exist_ok=True)
-            with open(self.metrics_file, 'w') as f:
-                json.dump(self.metrics, f, indent=2)
+            
+            # Compact output, swapped in atomically so a crash never leaves a torn file
+            tmp_file = self.metrics_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_dumps(metrics))
+            os.replace(tmp_file, self.metrics_file)
         except Exception as e:
             print(f"Error saving metrics: {e}")
     
@@ -149,6 +298,15 @@ class AccuracyMonitor:
             if Path(self.metrics_file).exists():
                 with open(self.metrics_file, 'r') as f:
                     self.metrics = json.load(f)
+                self.metrics['fps_history'] = deque(
+                    (dict(m, timestamp=datetime.fromisoformat(m['timestamp']).timestamp())
+                     for m in self.metrics.get('fps_history', [])),
+                    maxlen=100
+                )
+                self._fps_window.clear()
+                self._fps_sum = 0.0
+                for m in islice(self.metrics['fps_history'], max(0, len(self.metrics['fps_history']) - 10), None):
+                    self._push_fps(m['fps'])
                 print("📊 Previous accuracy metrics loaded")
         except Exception as e:
             print(f"Error loading metrics: {e}")
@@ -209,6 +367,8 @@ def interactive_accuracy_test():
     except KeyboardInterrupt:
         monitor.save_metrics()
         print("\n📊 Accuracy monitoring stopped. Metrics saved.")
+    finally:
+        monitor.close()
 
 
 if __name__ == "__main__":
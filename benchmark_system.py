@@ -5,10 +5,21 @@ Tests and measures system performance metrics
 """
 
 import time
+import threading
 import cv2
 import numpy as np
 from datetime import datetime
-import statistics
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2).encode()
 
 def benchmark_camera_performance(camera_index=0, duration=30):
     """Benchmark camera capture performance."""
@@ -24,41 +35,59 @@ def benchmark_camera_performance(camera_index=0, duration=30):
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
     cap.set(cv2.CAP_PROP_FPS, 30)
     
-    frame_times = []
+    # Capture runs on a reader thread; cap.read() releases the GIL while blocking
+    capacity = max(1, int(duration * 120))
+    read_ns = np.empty(capacity, dtype=np.int64)
     frame_count = 0
-    start_time = time.time()
+    failed_reads = 0
+    stop_event = threading.Event()
     
-    while time.time() - start_time < duration:
-        frame_start = time.time()
-        ret, frame = cap.read()
-        frame_end = time.time()
-        
-        if ret:
-            frame_times.append(frame_end - frame_start)
-            frame_count += 1
-        else:
-            print("⚠️  Failed to read frame")
+    def reader():
+        nonlocal frame_count, failed_reads
+        while not stop_event.is_set() and frame_count < capacity:
+            frame_start = time.perf_counter_ns()
+            ret, _ = cap.read()
+            frame_end = time.perf_counter_ns()
+            
+            if ret:
+                read_ns[frame_count] = frame_end - frame_start
+                frame_count += 1
+            else:
+                failed_reads += 1
+    
+    reader_thread = threading.Thread(target=reader, daemon=True)
+    reader_thread.start()
+    reader_thread.join(timeout=duration)
+    stop_event.set()
+    reader_thread.join()
     
     cap.release()
     
-    if frame_times:
-        avg_frame_time = statistics.mean(frame_times)
+    if failed_reads:
+        print(f"⚠️  Failed to read {failed_reads} frames")
+    
+    if frame_count:
+        frame_times = read_ns[:frame_count] / 1e9
+        avg_frame_time = float(frame_times.mean())
+        min_frame_time = float(frame_times.min())
+        max_frame_time = float(frame_times.max())
         fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0
         
         results = {
             'duration': duration,
             'frames_captured': frame_count,
             'average_fps': fps,
-            'min_frame_time': min(frame_times),
-            'max_frame_time': max(frame_times),
-            'avg_frame_time': avg_frame_time
+            'min_frame_time': min_frame_time,
+            'max_frame_time': max_frame_time,
+            'avg_frame_time': avg_frame_time,
+            'std_frame_time': float(frame_times.std())
         }
         
         print(f"✅ Camera Performance Results:")
         print(f"   Frames Captured: {frame_count}")
         print(f"   Average FPS: {fps:.1f}")
         print(f"   Frame Time: {avg_frame_time*1000:.1f}ms (avg)")
-        print(f"   Frame Time Range: {min(frame_times)*1000:.1f}-{max(frame_times)*1000:.1f}ms")
+        print(f"   Frame Time Range: {min_frame_time*1000:.1f}-{max_frame_time*1000:.1f}ms")
         
         return results
     
@@ -72,37 +101,42 @@ def benchmark_detection_performance(num_frames=100):
         from src.detector import create_detector
         detector = create_detector()
         
-        # Create test frames
-        test_frame = np.random.randint(0, 255, (720, 1280, 3), dtype=np.uint8)
+        # Create a small pool of distinct test frames so detector caches stay cold
+        num_test_frames = 8
+        rng = np.random.default_rng()
+        test_frames = rng.integers(0, 255, (num_test_frames, 720, 1280, 3), dtype=np.uint8)
         
-        detection_times = []
+        # Preallocated ns timings keep harness overhead out of the measurement
+        detection_ns = np.empty(num_frames, dtype=np.int64)
         
         for i in range(num_frames):
-            start_time = time.time()
-            detections = detector.detect_persons(test_frame)
-            end_time = time.time()
-            
-            detection_times.append(end_time - start_time)
+            start_ns = time.perf_counter_ns()
+            detections = detector.detect_persons(test_frames[i % num_test_frames])
+            detection_ns[i] = time.perf_counter_ns() - start_ns
             
             if (i + 1) % 20 == 0:
                 print(f"   Processed {i + 1}/{num_frames} frames...")
         
-        avg_detection_time = statistics.mean(detection_times)
+        detection_times = detection_ns / 1e9
+        avg_detection_time = float(detection_times.mean())
+        min_detection_time = float(detection_times.min())
+        max_detection_time = float(detection_times.max())
         detection_fps = 1.0 / avg_detection_time if avg_detection_time > 0 else 0
         
         results = {
             'frames_processed': num_frames,
             'avg_detection_time': avg_detection_time,
             'detection_fps': detection_fps,
-            'min_detection_time': min(detection_times),
-            'max_detection_time': max(detection_times)
+            'min_detection_time': min_detection_time,
+            'max_detection_time': max_detection_time,
+            'std_detection_time': float(detection_times.std())
         }
         
         print(f"✅ Detection Performance Results:")
         print(f"   Frames Processed: {num_frames}")
         print(f"   Average Detection Time: {avg_detection_time*1000:.1f}ms")
         print(f"   Detection FPS: {detection_fps:.1f}")
-        print(f"   Time Range: {min(detection_times)*1000:.1f}-{max(detection_times)*1000:.1f}ms")
+        print(f"   Time Range: {min_detection_time*1000:.1f}-{max_detection_time*1000:.1f}ms")
         
         return results
         
@@ -125,18 +159,17 @@ def benchmark_full_system(duration=60):
             return None
         
         frame_count = 0
-        processing_times = []
+        capacity = max(1, int(duration * 120))
+        processing_ns = np.empty(capacity, dtype=np.int64)
         start_time = time.time()
         
-        while time.time() - start_time < duration:
+        while time.time() - start_time < duration and frame_count < capacity:
             ret, frame = system.camera.read()
             
             if ret:
-                process_start = time.time()
+                process_start = time.perf_counter_ns()
                 processed_frame = system._process_frame(frame)
-                process_end = time.time()
-                
-                processing_times.append(process_end - process_start)
+                processing_ns[frame_count] = time.perf_counter_ns() - process_start
                 frame_count += 1
                 
                 if frame_count % 30 == 0:
@@ -145,8 +178,11 @@ def benchmark_full_system(duration=60):
         
         system._cleanup()
         
-        if processing_times:
-            avg_processing_time = statistics.mean(processing_times)
+        if frame_count:
+            processing_times = processing_ns[:frame_count] / 1e9
+            avg_processing_time = float(processing_times.mean())
+            min_processing_time = float(processing_times.min())
+            max_processing_time = float(processing_times.max())
             system_fps = 1.0 / avg_processing_time if avg_processing_time > 0 else 0
             
             results = {
@@ -154,15 +190,16 @@ def benchmark_full_system(duration=60):
                 'frames_processed': frame_count,
                 'avg_processing_time': avg_processing_time,
                 'system_fps': system_fps,
-                'min_processing_time': min(processing_times),
-                'max_processing_time': max(processing_times)
+                'min_processing_time': min_processing_time,
+                'max_processing_time': max_processing_time,
+                'std_processing_time': float(processing_times.std())
             }
             
             print(f"✅ Full System Performance Results:")
             print(f"   Frames Processed: {frame_count}")
             print(f"   Average Processing Time: {avg_processing_time*1000:.1f}ms")
             print(f"   System FPS: {system_fps:.1f}")
-            print(f"   Processing Range: {min(processing_times)*1000:.1f}-{max(processing_times)*1000:.1f}ms")
+            print(f"   Processing Range: {min_processing_time*1000:.1f}-{max_processing_time*1000:.1f}ms")
             
             return results
         
@@ -233,9 +270,8 @@ def run_comprehensive_benchmark():
     filename = f"benchmark_results_{timestamp}.json"
     
     try:
-        import json
-        with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps(results))
         print(f"📁 Results saved to: {filename}")
     except Exception as e:
         print(f"⚠️  Could not save results: {e}")
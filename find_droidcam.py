@@ -3,22 +3,39 @@
 Quick script to find DroidCam after setup
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 
+
+def probe(i):
+    """Open camera i and grab one frame; returns (index, opened, frame)."""
+    cap = cv2.VideoCapture(i)
+    try:
+        if not cap.isOpened():
+            return i, False, None
+        ret, frame = cap.read()
+        return i, True, frame if ret else None
+    finally:
+        cap.release()
+
+
 print("🔍 Looking for DroidCam camera...")
 print("Make sure DroidCam is connected and running!")
 print("=" * 50)
 
-for i in range(5):
+# Probes are independent and block in the driver, so run them side by side
+with ThreadPoolExecutor(max_workers=5) as executor:
+    results = list(executor.map(probe, range(5)))
+
+for i, opened, frame in results:
     print(f"Testing camera {i}...", end=" ")
-    cap = cv2.VideoCapture(i)
-    
-    if cap.isOpened():
-        ret, frame = cap.read()
-        if ret:
+
+    if opened:
+        if frame is not None:
             h, w = frame.shape[:2]
             print(f"✅ Found camera - Resolution: {w}x{h}")
-            
+
             # Show preview
             cv2.imshow(f'Camera {i}', frame)
             cv2.waitKey(2000)
@@ -27,8 +44,6 @@ for i in range(5):
             print("❌ Can't read")
     else:
         print("❌ Not available")
-    
-    cap.release()
 
 print("\n💡 After setting up DroidCam, update your .env file:")
 print("   CAMERA_SOURCE=X  (where X is your DroidCam camera index)")
\ No newline at end of file
@@ -3,6 +3,8 @@ Laptop Camera Configuration
 Optimized settings for built-in laptop cameras
 """
 
+import os
+
 def configure_for_laptop_camera():
     """Configure system for optimal laptop camera performance."""
     
@@ -33,8 +35,14 @@ LOG_LEVEL=INFO
 LOG_FILE=logs/crowd_monitor.log
 """
     
-    with open('.env', 'w') as f:
-        f.write(env_content)
+    # Write to a temp file and swap it in so an interrupted run never leaves a torn .env
+    fd = os.open('.env.tmp', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, env_content.encode())
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace('.env.tmp', '.env')
     
     print("✅ Laptop camera configuration applied!")
     print("📹 Camera source set to 0 (built-in laptop camera)")
@@ -4,8 +4,10 @@ Crowd Monitoring System - Main startup script.
 Provides options to run the system in different modes.
 """
 
+import os
 import sys
 import argparse
+import importlib.util
 import threading
 import time
 from pathlib import Path
@@ -115,11 +117,11 @@ def check_system():
     print("\nDependency Check:")
     missing_modules = []
     
+    # Resolve specs only; importing torch/ultralytics here would take seconds
     for module, package in required_modules:
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"✅ {module}")
-        except ImportError:
+        else:
             print(f"❌ {module} (install: pip install {package})")
             if package != 'built-in' and 'optional' not in package:
                 missing_modules.append(package)
@@ -163,6 +165,14 @@ def check_system():
         return True
 
 
+DISPATCH = {
+    'counter': run_counter_only,
+    'dashboard': run_dashboard_only,
+    'full': run_with_dashboard,
+    'check': check_system,
+}
+
+
 def main():
     """Main entry point with command-line argument parsing."""
     parser = argparse.ArgumentParser(
@@ -191,7 +201,7 @@ Controls (Counter Mode):
     
     parser.add_argument(
         'mode',
-        choices=['counter', 'dashboard', 'full', 'check'],
+        choices=list(DISPATCH),
         help='Operating mode'
     )
     
@@ -216,31 +226,15 @@ Controls (Counter Mode):
     
     args = parser.parse_args()
     
+    # Update config for custom host/port
+    if args.mode in ('dashboard', 'full') and (args.host != 'localhost' or args.port != 5000):
+        os.environ['FLASK_HOST'] = args.host
+        os.environ['FLASK_PORT'] = str(args.port)
+    
+    result = DISPATCH[args.mode]()
+    
     if args.mode == 'check':
-        success = check_system()
-        sys.exit(0 if success else 1)
-    
-    elif args.mode == 'counter':
-        run_counter_only()
-    
-    elif args.mode == 'dashboard':
-        # Update config for custom host/port
-        if args.host != 'localhost' or args.port != 5000:
-            import os
-            os.environ['FLASK_HOST'] = args.host
-            os.environ['FLASK_PORT'] = str(args.port)
-        
-        run_dashboard_only()
-    
-    elif args.mode == 'full':
-        # Update config for custom host/port
-        if args.host != 'localhost' or args.port != 5000:
-            import os
-            os.environ['FLASK_HOST'] = args.host
-            os.environ['FLASK_PORT'] = str(args.port)
-        
-        run_with_dashboard()
-
+        sys.exit(0 if result else 1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,10 +4,29 @@ Provides count reset, configuration management, and system administration featur
 """
 
 import logging
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Dict, List, Optional, Any, Tuple
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Tuple, Callable
 import json
+import mmap
+import multiprocessing
 import os
+import pickle
+import queue
+import sqlite3
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from utils.config import get_config, reload_config
 from utils.logger import default_logger, log_system_event
@@ -16,29 +35,271 @@ from src.alerts import create_alert_manager
 from src.reports import create_report_generator
 
 
+# Shared pool for overlapping the database reads in get_system_status
+_status_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="admin-status")
+
+# Default for AdminResult.get that no stored value can equal
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    """
+    Immutable view of the settings the admin controller reads on hot paths.
+    """
+    version: int
+    crowd_limit: int
+    warning_threshold: int
+    alert_enabled: bool
+    sound_alerts: bool
+    popup_alerts: bool
+    alert_cooldown: int
+
+
+class AdminResult:
+    """
+    Outcome of an administrative operation.
+    
+    Supports item access (result['success'], result.get('files')) so callers
+    written against the old dictionary responses keep working.
+    """
+    __slots__ = ("success", "timestamp", "admin_user", "message", "error", "details")
+    
+    # Leading keys of every response, copied rather than rebuilt per call
+    _RESULT_TEMPLATE = {"success": False, "timestamp": None, "admin_user": None}
+    
+    def __init__(self, success: bool, timestamp: datetime, admin_user: str,
+                 message: str, error: Optional[str] = None,
+                 details: Optional[Dict[str, Any]] = None):
+        self.success = success
+        self.timestamp = timestamp
+        self.admin_user = admin_user
+        self.message = message
+        self.error = error
+        self.details = details or {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__ and key != "details":
+            value = getattr(self, key)
+            if key == "error" and value is None:
+                raise KeyError(key)
+            return value
+        return self.details[key]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def keys(self):
+        return self.as_dict().keys()
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Flatten to the JSON-ready response layout.
+        
+        Returns:
+            Dictionary with success, timestamp, admin_user, operation details,
+            error (if any) and message
+        """
+        result = self._RESULT_TEMPLATE.copy()
+        result["success"] = self.success
+        result["timestamp"] = self.timestamp
+        result["admin_user"] = self.admin_user
+        result.update(self.details)
+        if self.error is not None:
+            result["error"] = self.error
+        result["message"] = self.message
+        return result
+
+
+class SharedAuditRing:
+    """
+    Fixed-size circular buffer of admin action records in shared memory.
+    
+    The buffer is an anonymous MAP_SHARED mapping, so it is shared only with
+    processes forked after it is created: build it in the parent before forking
+    workers and pass it to each AdminController. Servers that spawn their
+    workers (hypercorn, for one) give every worker a fresh interpreter, and
+    there the default per-controller deque is just as good.
+    """
+    SLOT_SIZE = 4096
+    _HEADER = struct.Struct("<Q")   # total records ever written
+    _LENGTH = struct.Struct("<I")   # pickled record size within a slot
+    
+    def __init__(self, capacity: int = 200):
+        """
+        Allocate the shared mapping.
+        
+        Args:
+            capacity: Number of records kept before the oldest is overwritten
+        """
+        self.capacity = capacity
+        self._mm = mmap.mmap(-1, self._HEADER.size + capacity * self.SLOT_SIZE,
+                             flags=mmap.MAP_SHARED | mmap.MAP_ANONYMOUS)
+        self._lock = multiprocessing.Lock()
+    
+    def _slot_offset(self, index: int) -> int:
+        return self._HEADER.size + (index % self.capacity) * self.SLOT_SIZE
+    
+    def _encode(self, record: Dict[str, Any]) -> bytes:
+        """
+        Pickle a record so that it fits in one slot.
+        
+        Oversized records keep their details as a string cut down (by encoded
+        size) until the pickle fits; if even that fails, only a short stub of
+        the record is stored.
+        
+        Args:
+            record: Admin action record
+            
+        Returns:
+            Pickled record of at most SLOT_SIZE minus the length header bytes
+        """
+        max_payload = self.SLOT_SIZE - self._LENGTH.size
+        data = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) <= max_payload:
+            return data
+        
+        # Keep the record but cut its details down to fit the slot
+        details = str(record.get("details"))
+        while details:
+            details = details[:len(details) // 2]
+            data = pickle.dumps(dict(record, details=details + " [truncated]"),
+                                protocol=pickle.HIGHEST_PROTOCOL)
+            if len(data) <= max_payload:
+                return data
+        
+        # Other fields alone are too large
+        stub = {
+            "timestamp": record.get("timestamp"),
+            "action": str(record.get("action"))[:200],
+            "admin_user": str(record.get("admin_user"))[:200],
+            "details": "[record too large for the audit log]"
+        }
+        return pickle.dumps(stub, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    def append(self, record: Dict[str, Any]):
+        """
+        Write a record into the next slot, overwriting the oldest when full.
+        
+        Args:
+            record: Admin action record
+        """
+        data = self._encode(record)
+        if len(data) > self.SLOT_SIZE - self._LENGTH.size:
+            raise ValueError(f"Audit record of {len(data)} bytes does not fit a {self.SLOT_SIZE}-byte slot")
+        with self._lock:
+            total = self._HEADER.unpack_from(self._mm, 0)[0]
+            offset = self._slot_offset(total)
+            self._LENGTH.pack_into(self._mm, offset, len(data))
+            self._mm[offset + self._LENGTH.size:offset + self._LENGTH.size + len(data)] = data
+            self._HEADER.pack_into(self._mm, 0, total + 1)
+    
+    def tail(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        Read the most recent records.
+        
+        Args:
+            limit: Maximum number of records to return
+            
+        Returns:
+            Records oldest first
+        """
+        with self._lock:
+            total = self._HEADER.unpack_from(self._mm, 0)[0]
+            first = max(0, total - min(limit, self.capacity))
+            raw = []
+            for index in range(first, total):
+                offset = self._slot_offset(index)
+                size = self._LENGTH.unpack_from(self._mm, offset)[0]
+                start = offset + self._LENGTH.size
+                raw.append(self._mm[start:start + size])
+        return [pickle.loads(data) for data in raw]
+    
+    def __len__(self) -> int:
+        return min(self._HEADER.unpack_from(self._mm, 0)[0], self.capacity)
+
+
+def create_shared_audit_ring(capacity: int = 200) -> Optional[SharedAuditRing]:
+    """
+    Create an audit ring for sharing with forked worker processes.
+    
+    Args:
+        capacity: Number of records kept before the oldest is overwritten
+        
+    Returns:
+        SharedAuditRing instance, or None where shared mmap is unavailable
+    """
+    if not hasattr(mmap, "MAP_ANONYMOUS"):
+        return None
+    try:
+        return SharedAuditRing(capacity=capacity)
+    except (OSError, ValueError, ImportError, PermissionError):
+        # ImportError/OSError: no working multiprocessing semaphores on this platform
+        return None
+
+
 class AdminController:
     """
     Handles administrative functions for the people counter system.
     """
     
-    def __init__(self, logger: logging.Logger = None):
+    # Audit log flushing: emit a batch every interval or once this many records queue up
+    AUDIT_FLUSH_INTERVAL = 0.5
+    AUDIT_BATCH_SIZE = 100
+    AUDIT_QUEUE_SIZE = 10_000
+    
+    # Report type -> generator call
+    _REPORT_DISPATCH = {
+        "daily": lambda rg, d: rg.generate_daily_report(d),
+        "weekly": lambda rg, d: rg.generate_weekly_report(d),
+        "monthly": lambda rg, d: rg.generate_monthly_report(d.year, d.month),
+    }
+    
+    def __init__(self, logger: logging.Logger = None,
+                 audit_ring: Optional[SharedAuditRing] = None):
         """
         Initialize admin controller.
         
         Args:
             logger (logging.Logger): Logger instance
+            audit_ring (SharedAuditRing): Audit log shared with forked workers;
+                by default each controller keeps its own in-memory log
         """
         self.config = get_config()
         self.logger = logger or default_logger
         self.db_manager = get_database_manager()
         self.alert_manager = create_alert_manager()
-        self.report_generator = create_report_generator()
+        
+        # Config summary cache, rebuilt only when the config version changes
+        self._cached_summary = None
+        self._cached_version = -1
+        
+        # Settings snapshot, refreshed after every admin update; listeners are told about each refresh
+        self._config_listeners: List[Callable[[ConfigSnapshot], None]] = []
+        self._config_snapshot = self._snapshot_config()
         
         # Admin session tracking
         self.session_start = datetime.now()
-        self.admin_actions = []
+        self.admin_actions = audit_ring if audit_ring is not None else deque(maxlen=200)
+        
+        # Audit records are serialized and logged by a background flusher
+        self._audit_queue = queue.Queue(maxsize=self.AUDIT_QUEUE_SIZE)
+        self.dropped_audit_count = 0
+        self._audit_thread = threading.Thread(target=self._audit_flusher, daemon=True)
+        self._audit_thread.start()
     
-    def reset_all_counts(self, reason: str = "Admin reset", admin_user: str = "system") -> Dict[str, Any]:
+    @cached_property
+    def report_generator(self):
+        """Report generator, built on first use since only report requests need it."""
+        return create_report_generator()
+    
+    def reset_all_counts(self, reason: str = "Admin reset", admin_user: str = "system") -> AdminResult:
         """
         Reset all people counts to zero.
         
@@ -47,54 +308,60 @@ class AdminController:
             admin_user (str): Name of admin performing the action
             
         Returns:
-            Dictionary with reset operation results
+            AdminResult with reset operation results
         """
+        ts = datetime.now()
+        db, log = self.db_manager, self.logger
         try:
-            log_system_event(self.logger, f"Admin reset initiated by {admin_user}", reason)
+            log_system_event(log, f"Admin reset initiated by {admin_user}", reason)
             
             # Get current counts before reset
-            current_counts = self.db_manager.get_current_count()
+            current_counts = db.get_current_count()
             
             # Perform reset
-            success = self.db_manager.reset_counts(f"{reason} (by {admin_user})")
+            success = db.reset_counts(f"{reason} (by {admin_user})")
             
             # Log admin action
             self._log_admin_action("reset_counts", admin_user, {
                 "reason": reason,
                 "previous_counts": current_counts,
                 "success": success
-            })
+            }, timestamp=ts)
             
             # Clear any active alerts
             if success:
                 self.alert_manager.clear_all_alerts()
             
-            result = {
-                "success": success,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "reason": reason,
-                "previous_counts": current_counts,
-                "message": "Counts reset successfully" if success else "Failed to reset counts"
-            }
+            result = AdminResult(
+                success=success,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Counts reset successfully" if success else "Failed to reset counts",
+                details={
+                    "reason": reason,
+                    "previous_counts": current_counts
+                }
+            )
             
-            log_system_event(self.logger, "Admin reset completed", f"Success: {success}")
+            log_system_event(log, "Admin reset completed", f"Success: {success}")
             return result
             
         except Exception as e:
             error_msg = f"Error during admin reset: {e}"
-            log_system_event(self.logger, "Admin reset failed", str(e))
-            
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "reason": reason,
-                "error": error_msg,
-                "message": "Reset operation failed"
-            }
+            log_system_event(log, "Admin reset failed", str(e))
+            
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Reset operation failed",
+                error=error_msg,
+                details={
+                    "reason": reason
+                }
+            )
     
-    def update_crowd_limit(self, new_limit: int, admin_user: str = "system") -> Dict[str, Any]:
+    def update_crowd_limit(self, new_limit: int, admin_user: str = "system") -> AdminResult:
         """
         Update the crowd limit threshold.
         
@@ -103,50 +370,54 @@ class AdminController:
             admin_user (str): Name of admin performing the action
             
         Returns:
-            Dictionary with update operation results
+            AdminResult with update operation results
         """
+        ts = datetime.now()
         try:
             if new_limit <= 0:
                 raise ValueError("Crowd limit must be greater than 0")
             
-            old_limit = self.config.CROWD_LIMIT
+            old_limit = self._get_config_snapshot().crowd_limit
             
             # Update configuration
             self.config.update_crowd_limit(new_limit)
+            self._publish_config_change()
             
             # Log admin action
             self._log_admin_action("update_crowd_limit", admin_user, {
                 "old_limit": old_limit,
                 "new_limit": new_limit
-            })
+            }, timestamp=ts)
             
             log_system_event(self.logger, f"Crowd limit updated by {admin_user}", 
                            f"From {old_limit} to {new_limit}")
             
-            return {
-                "success": True,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "old_limit": old_limit,
-                "new_limit": new_limit,
-                "message": f"Crowd limit updated to {new_limit}"
-            }
+            return AdminResult(
+                success=True,
+                timestamp=ts,
+                admin_user=admin_user,
+                message=f"Crowd limit updated to {new_limit}",
+                details={
+                    "old_limit": old_limit,
+                    "new_limit": new_limit
+                }
+            )
             
         except Exception as e:
             error_msg = f"Error updating crowd limit: {e}"
             log_system_event(self.logger, "Crowd limit update failed", str(e))
             
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "error": error_msg,
-                "message": "Failed to update crowd limit"
-            }
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Failed to update crowd limit",
+                error=error_msg
+            )
     
     def update_counting_line(self, start_coords: Tuple[float, float], 
                            end_coords: Tuple[float, float], 
-                           admin_user: str = "system") -> Dict[str, Any]:
+                           admin_user: str = "system") -> AdminResult:
         """
         Update the counting line position.
         
@@ -156,53 +427,57 @@ class AdminController:
             admin_user: Name of admin performing the action
             
         Returns:
-            Dictionary with update operation results
+            AdminResult with update operation results
         """
+        ts = datetime.now()
         try:
             # Validate coordinates
-            for coord in start_coords + end_coords:
-                if not (0.0 <= coord <= 1.0):
-                    raise ValueError("Coordinates must be between 0.0 and 1.0")
+            coords = (*start_coords, *end_coords)
+            if min(coords) < 0.0 or max(coords) > 1.0:
+                raise ValueError("Coordinates must be between 0.0 and 1.0")
             
             old_line = self.config.COUNTING_LINE.copy()
             
             # Update configuration
             self.config.update_counting_line(start_coords, end_coords)
+            self._publish_config_change()
             
             # Log admin action
             self._log_admin_action("update_counting_line", admin_user, {
                 "old_line": old_line,
                 "new_start": start_coords,
                 "new_end": end_coords
-            })
+            }, timestamp=ts)
             
             log_system_event(self.logger, f"Counting line updated by {admin_user}", 
                            f"Start: {start_coords}, End: {end_coords}")
             
-            return {
-                "success": True,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "old_line": old_line,
-                "new_line": self.config.COUNTING_LINE,
-                "message": "Counting line position updated"
-            }
+            return AdminResult(
+                success=True,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Counting line position updated",
+                details={
+                    "old_line": old_line,
+                    "new_line": self.config.COUNTING_LINE
+                }
+            )
             
         except Exception as e:
             error_msg = f"Error updating counting line: {e}"
             log_system_event(self.logger, "Counting line update failed", str(e))
             
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "error": error_msg,
-                "message": "Failed to update counting line"
-            }
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Failed to update counting line",
+                error=error_msg
+            )
     
     def update_alert_settings(self, alerts_enabled: bool = None, 
                             sound_alerts: bool = None, popup_alerts: bool = None,
-                            alert_cooldown: int = None, admin_user: str = "system") -> Dict[str, Any]:
+                            alert_cooldown: int = None, admin_user: str = "system") -> AdminResult:
         """
         Update alert system settings.
         
@@ -214,15 +489,11 @@ class AdminController:
             admin_user: Name of admin performing the action
             
         Returns:
-            Dictionary with update operation results
+            AdminResult with update operation results
         """
+        ts = datetime.now()
         try:
-            old_settings = {
-                "alerts_enabled": self.config.ALERT_ENABLED,
-                "sound_alerts": self.config.SOUND_ALERTS,
-                "popup_alerts": self.config.POPUP_ALERTS,
-                "alert_cooldown": self.config.ALERT_COOLDOWN
-            }
+            old_settings = self._get_alert_settings()
             
             # Update alert manager settings
             self.alert_manager.update_settings(
@@ -241,46 +512,45 @@ class AdminController:
                 self.config.POPUP_ALERTS = popup_alerts
             if alert_cooldown is not None:
                 self.config.ALERT_COOLDOWN = alert_cooldown
+            self.config.mark_changed()
+            self._publish_config_change()
             
-            new_settings = {
-                "alerts_enabled": self.config.ALERT_ENABLED,
-                "sound_alerts": self.config.SOUND_ALERTS,
-                "popup_alerts": self.config.POPUP_ALERTS,
-                "alert_cooldown": self.config.ALERT_COOLDOWN
-            }
+            new_settings = self._get_alert_settings()
             
             # Log admin action
             self._log_admin_action("update_alert_settings", admin_user, {
                 "old_settings": old_settings,
                 "new_settings": new_settings
-            })
+            }, timestamp=ts)
             
             log_system_event(self.logger, f"Alert settings updated by {admin_user}")
             
-            return {
-                "success": True,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "old_settings": old_settings,
-                "new_settings": new_settings,
-                "message": "Alert settings updated successfully"
-            }
+            return AdminResult(
+                success=True,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Alert settings updated successfully",
+                details={
+                    "old_settings": old_settings,
+                    "new_settings": new_settings
+                }
+            )
             
         except Exception as e:
             error_msg = f"Error updating alert settings: {e}"
             log_system_event(self.logger, "Alert settings update failed", str(e))
             
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "error": error_msg,
-                "message": "Failed to update alert settings"
-            }
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Failed to update alert settings",
+                error=error_msg
+            )
     
     def generate_system_report(self, report_type: str = "daily", 
                              target_date: date = None, 
-                             admin_user: str = "system") -> Dict[str, Any]:
+                             admin_user: str = "system") -> AdminResult:
         """
         Generate system reports on demand.
         
@@ -290,26 +560,21 @@ class AdminController:
             admin_user: Name of admin performing the action
             
         Returns:
-            Dictionary with report generation results
+            AdminResult with report generation results
         """
+        ts = datetime.now()
         try:
             if target_date is None:
-                target_date = date.today()
+                target_date = ts.date()
             
             log_system_event(self.logger, f"Report generation initiated by {admin_user}", 
                            f"Type: {report_type}, Date: {target_date}")
             
             # Generate report based on type
-            if report_type == "daily":
-                report_data = self.report_generator.generate_daily_report(target_date)
-            elif report_type == "weekly":
-                report_data = self.report_generator.generate_weekly_report(target_date)
-            elif report_type == "monthly":
-                report_data = self.report_generator.generate_monthly_report(
-                    target_date.year, target_date.month
-                )
-            else:
+            generate = self._REPORT_DISPATCH.get(report_type)
+            if generate is None:
                 raise ValueError(f"Invalid report type: {report_type}")
+            report_data = generate(self.report_generator, target_date)
             
             # Export reports
             csv_file = ""
@@ -317,9 +582,15 @@ class AdminController:
             chart_files = []
             
             if report_data:
-                csv_file = self.report_generator.export_to_csv(report_data)
-                excel_file = self.report_generator.export_to_excel(report_data)
-                chart_files = self.report_generator.generate_charts(report_data)
+                # CSV, Excel and chart exports are independent; run them side by side
+                rg = self.report_generator
+                with ThreadPoolExecutor(max_workers=3, thread_name_prefix="admin-export") as executor:
+                    csv_future = executor.submit(rg.export_to_csv, report_data)
+                    excel_future = executor.submit(rg.export_to_excel, report_data)
+                    charts_future = executor.submit(rg.generate_charts, report_data)
+                    csv_file = csv_future.result()
+                    excel_file = excel_future.result()
+                    chart_files = charts_future.result()
             
             # Log admin action
             self._log_admin_action("generate_report", admin_user, {
@@ -330,23 +601,25 @@ class AdminController:
                     "excel": excel_file,
                     "charts": chart_files
                 }
-            })
-            
-            result = {
-                "success": bool(report_data),
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "report_type": report_type,
-                "target_date": target_date,
-                "report_data": report_data,
-                "files": {
-                    "csv": csv_file,
-                    "excel": excel_file,
-                    "charts": chart_files
-                },
-                "message": f"{report_type.title()} report generated successfully" if report_data 
-                          else "Report generation failed"
-            }
+            }, timestamp=ts)
+            
+            result = AdminResult(
+                success=bool(report_data),
+                timestamp=ts,
+                admin_user=admin_user,
+                message=f"{report_type.title()} report generated successfully" if report_data 
+                          else "Report generation failed",
+                details={
+                    "report_type": report_type,
+                    "target_date": target_date,
+                    "report_data": report_data,
+                    "files": {
+                        "csv": csv_file,
+                        "excel": excel_file,
+                        "charts": chart_files
+                    }
+                }
+            )
             
             log_system_event(self.logger, "Report generation completed", 
                            f"Success: {bool(report_data)}")
@@ -357,13 +630,13 @@ class AdminController:
             error_msg = f"Error generating report: {e}"
             log_system_event(self.logger, "Report generation failed", str(e))
             
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "error": error_msg,
-                "message": "Report generation failed"
-            }
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Report generation failed",
+                error=error_msg
+            )
     
     def get_system_status(self) -> Dict[str, Any]:
         """
@@ -372,27 +645,28 @@ class AdminController:
         Returns:
             Dictionary with system status data
         """
+        ts = datetime.now()
+        db, am = self.db_manager, self.alert_manager
         try:
-            # Get current counts
-            current_counts = self.db_manager.get_current_count()
-            
-            # Get today's statistics
-            today_stats = self.db_manager.get_daily_stats(date.today())
+            # Database queries run concurrently; sqlite3 releases the GIL while they execute
+            counts_future = _status_pool.submit(db.get_current_count)
+            stats_future = _status_pool.submit(db.get_daily_stats, ts.date())
             
-            # Get alert statistics
-            alert_stats = self.alert_manager.get_alert_statistics()
+            # Alert state is in memory, so read it while the queries run
+            alert_stats = am.get_alert_statistics()
+            active_alerts = am.get_active_alerts()
             
-            # Get active alerts
-            active_alerts = self.alert_manager.get_active_alerts()
+            current_counts = counts_future.result()
+            today_stats = stats_future.result()
             
             # System configuration summary
-            config_summary = self.config.get_summary()
+            config_summary = self._get_config_summary()
             
             # Admin session info
-            session_duration = (datetime.now() - self.session_start).total_seconds() / 60  # minutes
+            session_duration = (ts - self.session_start).total_seconds() / 60  # minutes
             
             status = {
-                "timestamp": datetime.now(),
+                "timestamp": ts,
                 "system_uptime_minutes": session_duration,
                 "current_counts": current_counts,
                 "today_statistics": today_stats,
@@ -401,7 +675,7 @@ class AdminController:
                     "active_alerts_count": len(active_alerts),
                     "active_alerts": [
                         {
-                            "type": alert.alert_type.value,
+                            "type": alert.alert_type.label,
                             "message": alert.message,
                             "timestamp": alert.timestamp
                         } for alert in active_alerts
@@ -409,6 +683,7 @@ class AdminController:
                 },
                 "configuration": config_summary,
                 "admin_actions_count": len(self.admin_actions),
+                "dropped_audit_count": self.dropped_audit_count,
                 "database_status": "connected",  # Could add actual health check
                 "system_health": "operational"   # Could add comprehensive health check
             }
@@ -418,12 +693,12 @@ class AdminController:
         except Exception as e:
             self.logger.error(f"Error getting system status: {e}")
             return {
-                "timestamp": datetime.now(),
+                "timestamp": ts,
                 "error": str(e),
                 "system_health": "error"
             }
     
-    def backup_database(self, backup_path: str = None, admin_user: str = "system") -> Dict[str, Any]:
+    def backup_database(self, backup_path: str = None, admin_user: str = "system") -> AdminResult:
         """
         Create a backup of the database.
         
@@ -432,46 +707,73 @@ class AdminController:
             admin_user: Name of admin performing the action
             
         Returns:
-            Dictionary with backup operation results
+            AdminResult with backup operation results
         """
+        ts = datetime.now()
         try:
             if backup_path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = f"{ts:%Y%m%d_%H%M%S}"
                 backup_path = f"{self.config.DATA_DIR}/backup_database_{timestamp}.db"
             
-            # Simple file copy backup
-            import shutil
-            shutil.copy2(self.config.DATABASE_PATH, backup_path)
+            # Online backup so commits still in the WAL are included
+            self._backup_sqlite(self.config.DATABASE_PATH, backup_path)
             
             # Log admin action
             self._log_admin_action("backup_database", admin_user, {
                 "backup_path": backup_path
-            })
+            }, timestamp=ts)
             
             log_system_event(self.logger, f"Database backup created by {admin_user}", backup_path)
             
-            return {
-                "success": True,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "backup_path": backup_path,
-                "message": "Database backup created successfully"
-            }
+            return AdminResult(
+                success=True,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Database backup created successfully",
+                details={
+                    "backup_path": backup_path
+                }
+            )
             
         except Exception as e:
             error_msg = f"Error creating database backup: {e}"
             log_system_event(self.logger, "Database backup failed", str(e))
             
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "error": error_msg,
-                "message": "Database backup failed"
-            }
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Database backup failed",
+                error=error_msg
+            )
+    
+    def _backup_sqlite(self, src: str, dst: str):
+        """
+        Copy a SQLite database with the online backup API.
+        
+        A raw file copy misses pages still sitting in the WAL file; the backup
+        API reads through SQLite, so the copy includes every committed transaction.
+        
+        Args:
+            src: Source database path (must exist)
+            dst: Destination database path
+            
+        Raises:
+            sqlite3.OperationalError: If the source database cannot be opened
+        """
+        # Read-only URI: a missing source raises instead of creating an empty database
+        source = sqlite3.connect(f"{Path(src).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            target = sqlite3.connect(dst)
+            try:
+                source.backup(target)
+            finally:
+                target.close()
+        finally:
+            source.close()
     
     def save_configuration(self, config_path: str = None, 
-                          admin_user: str = "system") -> Dict[str, Any]:
+                          admin_user: str = "system") -> AdminResult:
         """
         Save current configuration to file.
         
@@ -480,41 +782,118 @@ class AdminController:
             admin_user: Name of admin performing the action
             
         Returns:
-            Dictionary with save operation results
+            AdminResult with save operation results
         """
+        ts = datetime.now()
         try:
             if config_path is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                timestamp = f"{ts:%Y%m%d_%H%M%S}"
                 config_path = f"config_backup_{timestamp}.json"
             
-            self.config.save_to_file(config_path)
+            # Write beside the target, flush to disk, then swap in atomically
+            tmp_path = f"{config_path}.tmp"
+            self.config.save_to_file(tmp_path)
+            fd = os.open(tmp_path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, config_path)
             
             # Log admin action
             self._log_admin_action("save_configuration", admin_user, {
                 "config_path": config_path
-            })
+            }, timestamp=ts)
             
             log_system_event(self.logger, f"Configuration saved by {admin_user}", config_path)
             
-            return {
-                "success": True,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "config_path": config_path,
-                "message": "Configuration saved successfully"
-            }
+            return AdminResult(
+                success=True,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Configuration saved successfully",
+                details={
+                    "config_path": config_path
+                }
+            )
             
         except Exception as e:
             error_msg = f"Error saving configuration: {e}"
             log_system_event(self.logger, "Configuration save failed", str(e))
             
-            return {
-                "success": False,
-                "timestamp": datetime.now(),
-                "admin_user": admin_user,
-                "error": error_msg,
-                "message": "Configuration save failed"
-            }
+            return AdminResult(
+                success=False,
+                timestamp=ts,
+                admin_user=admin_user,
+                message="Configuration save failed",
+                error=error_msg
+            )
+    
+    def _get_config_summary(self) -> Dict[str, Any]:
+        """
+        Get the configuration summary, reusing the cached copy while config is unchanged.
+        
+        Returns:
+            Dictionary with key configuration values
+        """
+        version = self.config.get_version()
+        if self._cached_summary is None or version != self._cached_version:
+            self._cached_summary = self.config.get_summary()
+            self._cached_version = version
+        return self._cached_summary
+    
+    def _get_alert_settings(self) -> Dict[str, Any]:
+        """Snapshot the alert-related configuration values."""
+        snapshot = self._get_config_snapshot()
+        return {
+            "alerts_enabled": snapshot.alert_enabled,
+            "sound_alerts": snapshot.sound_alerts,
+            "popup_alerts": snapshot.popup_alerts,
+            "alert_cooldown": snapshot.alert_cooldown
+        }
+    
+    def _snapshot_config(self) -> ConfigSnapshot:
+        """Read the hot configuration values once into an immutable snapshot."""
+        config = self.config
+        return ConfigSnapshot(
+            version=config.get_version(),
+            crowd_limit=config.CROWD_LIMIT,
+            warning_threshold=config.WARNING_THRESHOLD,
+            alert_enabled=config.ALERT_ENABLED,
+            sound_alerts=config.SOUND_ALERTS,
+            popup_alerts=config.POPUP_ALERTS,
+            alert_cooldown=config.ALERT_COOLDOWN
+        )
+    
+    def _get_config_snapshot(self) -> ConfigSnapshot:
+        """
+        Get the current settings snapshot, rebuilding it if config changed elsewhere.
+        
+        Returns:
+            ConfigSnapshot matching the current config version
+        """
+        if self._config_snapshot.version != self.config.get_version():
+            self._config_snapshot = self._snapshot_config()
+        return self._config_snapshot
+    
+    def _publish_config_change(self):
+        """Refresh the settings snapshot and notify registered listeners."""
+        self._config_snapshot = self._snapshot_config()
+        
+        for listener in list(self._config_listeners):
+            try:
+                listener(self._config_snapshot)
+            except Exception as e:
+                self.logger.error(f"Error in config change listener: {e}")
+    
+    def register_config_listener(self, listener: Callable[[ConfigSnapshot], None]):
+        """
+        Register a callback invoked after each admin configuration change.
+        
+        Args:
+            listener: Function receiving the new ConfigSnapshot
+        """
+        self._config_listeners.append(listener)
     
     def get_admin_audit_log(self, limit: int = 50) -> List[Dict[str, Any]]:
         """
@@ -526,9 +905,13 @@ class AdminController:
         Returns:
             List of admin action records
         """
-        return self.admin_actions[-limit:] if self.admin_actions else []
+        actions = self.admin_actions
+        if isinstance(actions, SharedAuditRing):
+            return actions.tail(limit)
+        return list(islice(actions, max(0, len(actions) - limit), None))
     
-    def _log_admin_action(self, action: str, admin_user: str, details: Dict[str, Any]):
+    def _log_admin_action(self, action: str, admin_user: str, details: Dict[str, Any],
+                          timestamp: datetime = None):
         """
         Log an administrative action for audit purposes.
         
@@ -536,9 +919,10 @@ class AdminController:
             action: Type of admin action
             admin_user: Name of admin user
             details: Additional action details
+            timestamp: Time of the action (default: now)
         """
         action_record = {
-            "timestamp": datetime.now(),
+            "timestamp": timestamp or datetime.now(),
             "action": action,
             "admin_user": admin_user,
             "details": details
@@ -546,13 +930,72 @@ class AdminController:
         
         self.admin_actions.append(action_record)
         
-        # Keep only last 200 actions to prevent memory issues
-        if len(self.admin_actions) > 200:
-            self.admin_actions = self.admin_actions[-100:]
+        # Also log to system logger (batched on the flusher thread); skip the
+        # queue and serialization entirely when INFO records would be dropped
+        if self.logger.isEnabledFor(logging.INFO):
+            self._enqueue_audit_record(action_record)
+    
+    def _enqueue_audit_record(self, action_record: Dict[str, Any]):
+        """
+        Queue an audit record for logging, dropping the oldest pending one when full.
+        
+        Args:
+            action_record: Admin action record to log
+        """
+        while True:
+            try:
+                self._audit_queue.put_nowait(action_record)
+                return
+            except queue.Full:
+                try:
+                    self._audit_queue.get_nowait()
+                    self.dropped_audit_count += 1
+                except queue.Empty:
+                    pass
+    
+    def _audit_flusher(self):
+        """Drain queued admin actions and log each batch with a single call."""
+        while True:
+            batch = [self._audit_queue.get()]
+            deadline = time.monotonic() + self.AUDIT_FLUSH_INTERVAL
+            
+            while len(batch) < self.AUDIT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._audit_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            try:
+                self._flush_audit_batch(batch)
+            except Exception as e:
+                self.logger.error(f"Error flushing admin audit log: {e}")
+    
+    def _flush_audit_batch(self, batch: List[Dict[str, Any]]):
+        """
+        Write a batch of admin action records to the system logger.
+        
+        Args:
+            batch: Admin action records in the order they were made
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
-        # Also log to system logger
-        log_system_event(self.logger, f"Admin action: {action}", 
-                        f"User: {admin_user}, Details: {json.dumps(details, default=str)}")
+        entries = [
+            {
+                "action": record["action"],
+                "admin_user": record["admin_user"],
+                "details": record["details"]
+            } for record in batch
+        ]
+        if orjson is not None:
+            # Datetimes, dates and tuples are encoded natively; str() only for unknown types
+            payload = orjson.dumps(entries, default=str).decode()
+        else:
+            payload = json.dumps(entries, default=str)
+        log_system_event(self.logger, f"Admin actions ({len(batch)})", payload)
 
 
 def create_admin_controller() -> AdminController:
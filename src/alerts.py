@@ -4,40 +4,132 @@ Handles crowd limit notifications, safety alerts, and various notification metho
 """
 
 import logging
+import queue
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Callable, Optional, Any
-from enum import Enum
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Callable, Optional, Any, Tuple
+from enum import IntEnum
 import os
 import platform
 
+import numpy as np
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
 from utils.config import get_config
 from utils.logger import default_logger, log_alert
 from src.database import get_database_manager
 
 
-class AlertType(Enum):
-    """Types of alerts supported by the system."""
-    INFO = "info"
-    WARNING = "warning"
-    CRITICAL = "critical"
-    CROWD_WARNING = "crowd_warning"
-    CROWD_LIMIT = "crowd_limit"
-    SYSTEM_ERROR = "system_error"
+# Crowd alert messages, filled in only once an alert is actually raised
+_WARN_TMPL = "Approaching capacity limit: %d/%d"
+_LIMIT_TMPL = "CROWD LIMIT EXCEEDED: %d/%d"
+
+
+# Per-type result of a threshold check
+_BELOW, _COOLING, _RAISE = 0, 1, 2
+
+
+def _crowd_alert_states(count: int, warn: int, limit: int,
+                        next_warn: float, next_limit: float, now: float) -> Tuple[int, int]:
+    """
+    Classify a count against both thresholds and their cooldown deadlines.
+    
+    Returns:
+        (warning_state, limit_state), each _BELOW, _COOLING or _RAISE
+    """
+    warn_state = _BELOW if count < warn else (_COOLING if now < next_warn else _RAISE)
+    limit_state = _BELOW if count < limit else (_COOLING if now < next_limit else _RAISE)
+    return warn_state, limit_state
+
+
+class _SimpleTTLCache:
+    """
+    Minimal stand-in for cachetools.TTLCache used when cachetools is not installed.
+    
+    Entries share one TTL, so insertion order is also expiry order.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._expiry = OrderedDict()  # {key: monotonic expiry time}
+    
+    def __contains__(self, key) -> bool:
+        expiry = self._expiry.get(key)
+        return expiry is not None and expiry > time.monotonic()
+    
+    def __setitem__(self, key, value):
+        self._expiry.pop(key, None)
+        self._expiry[key] = time.monotonic() + self.ttl
+        if len(self._expiry) > self.maxsize:
+            self._expiry.popitem(last=False)
+    
+    def __iter__(self):
+        return iter(self._expiry)
+    
+    def expire(self):
+        """Drop expired entries from the front of the map."""
+        now = time.monotonic()
+        while self._expiry and next(iter(self._expiry.values())) <= now:
+            self._expiry.popitem(last=False)
+
+
+def _create_dedup_cache(ttl: float):
+    """Create the alert fingerprint cache, preferring cachetools when available."""
+    ttl = max(1, ttl)
+    if TTLCache is not None:
+        return TTLCache(maxsize=512, ttl=ttl, timer=time.monotonic)
+    return _SimpleTTLCache(maxsize=512, ttl=ttl)
+
+
+class AlertType(IntEnum):
+    """
+    Types of alerts supported by the system.
+    
+    Integer-valued so the many per-type dict lookups hash like plain ints;
+    use .label for the string stored in the database and shown in the UI.
+    """
+    INFO = 1
+    WARNING = 2
+    CRITICAL = 3
+    CROWD_WARNING = 4
+    CROWD_LIMIT = 5
+    SYSTEM_ERROR = 6
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name, e.g. "crowd_warning"."""
+        return _TYPE_LABELS[self]
 
 
-class AlertMethod(Enum):
+class AlertMethod(IntEnum):
     """Methods for delivering alerts."""
-    POPUP = "popup"
-    SOUND = "sound"
-    LOG = "log"
-    DATABASE = "database"
-    OVERLAY = "overlay"
+    POPUP = 1
+    SOUND = 2
+    LOG = 3
+    DATABASE = 4
+    OVERLAY = 5
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name, e.g. "popup"."""
+        return self.name.lower()
+
+
+_TYPE_LABELS = {alert_type: alert_type.name.lower() for alert_type in AlertType}
 
 
 class Alert:
     """Represents an alert event."""
+    __slots__ = ("alert_type", "message", "current_count", "threshold", "timestamp",
+                 "methods", "resolved", "resolved_timestamp", "_mono_ts", "_api_dict")
     
     def __init__(self, alert_type: AlertType, message: str, 
                  current_count: int = None, threshold: int = None,
@@ -47,9 +139,31 @@ class Alert:
         self.current_count = current_count
         self.threshold = threshold
         self.timestamp = datetime.now()
+        self._mono_ts = time.monotonic()  # for age checks; timestamp is for display and DB
         self.methods = methods or [AlertMethod.LOG, AlertMethod.OVERLAY]
         self.resolved = False
         self.resolved_timestamp = None
+        self._api_dict = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        JSON-ready view of the alert for the dashboard API.
+        
+        Built on first use and reused, as the fields it covers never change;
+        callers must not modify it.
+        
+        Returns:
+            Dict with type label, message, ISO timestamp, count and threshold
+        """
+        if self._api_dict is None:
+            self._api_dict = {
+                'type': self.alert_type.label,
+                'message': self.message,
+                'timestamp': self.timestamp.isoformat(),
+                'current_count': self.current_count,
+                'threshold': self.threshold
+            }
+        return self._api_dict
 
 
 class AlertManager:
@@ -57,6 +171,11 @@ class AlertManager:
     Manages all alert functionality for the people counter system.
     """
     
+    # Database alert rows are written in batches of up to this many, at least every interval
+    DB_BATCH_SIZE = 64
+    DB_FLUSH_INTERVAL = 0.5
+    DB_QUEUE_SIZE = 1024
+    
     def __init__(self, logger: logging.Logger = None):
         """
         Initialize alert manager.
@@ -75,19 +194,45 @@ class AlertManager:
         self.alert_cooldown = self.config.ALERT_COOLDOWN  # seconds
         
         # Alert state
-        self.active_alerts = []
-        self.alert_history = []
+        self.active_alerts = deque()  # oldest first
+        self.alert_history = deque(maxlen=100)
+        self._type_counts = Counter()  # alert type value -> occurrences in alert_history
+        self._latest_overlay = None  # newest unresolved overlay alert
+        self._overlay_stale = False  # set when _latest_overlay left the active list
         self.last_alert_times = {}  # {alert_type: timestamp}
-        self.alert_callbacks = {}  # {alert_type: [callback_functions]}
+        self._next_allowed = {AlertType.CROWD_WARNING: 0.0, AlertType.CROWD_LIMIT: 0.0}  # monotonic
+        self._dedup = _create_dedup_cache(self.alert_cooldown)  # {(alert_type, count, message)} seen recently
+        self._suppressed_counts = defaultdict(int)  # {alert_type: checks swallowed by the cooldown}
+        
+        # 8 kbit bloom filter over dedup keys: a clear bit proves the key is not cached
+        self._recent_bloom = bytearray(1024)
+        self._bloom_reset_at = time.monotonic() + max(1, self.alert_cooldown)
+        self.alert_callbacks = {}  # {alert_type: (callback_functions,)}, replaced on register
+        self.callback_errors = 0
         
-        # Threading for non-blocking alerts
-        self.alert_thread_pool = []
+        # Popups and sounds run on a small shared pool so they never block the caller
+        self._notifier_exec = ThreadPoolExecutor(max_workers=2, thread_name_prefix="alert-notify")
+        
+        # Alert rows are inserted by a background flusher so triggering never waits on SQLite
+        self._db_queue = queue.Queue(maxsize=self.DB_QUEUE_SIZE)
+        self._db_thread = threading.Thread(target=self._db_flusher, daemon=True)
+        self._db_thread.start()
         
         # Load platform-specific notification modules
         self._load_notification_modules()
+        
+        # {AlertMethod: handler}; disabled popup/sound methods map to a no-op
+        self._build_method_dispatch()
     
     def _load_notification_modules(self):
         """Load platform-specific notification modules."""
+        # Persistent session-bus connection for Linux desktop notifications (None if unavailable)
+        self._dbus_conn = None
+        
+        # Sound players are bound once here; without winsound there is no system sound to play
+        self.sound_available = False
+        self._critical_fn = self._warning_fn = self._default_fn = lambda: None
+        
         try:
             # Try to import notification libraries
             if platform.system() == "Windows":
@@ -95,9 +240,17 @@ class AlertManager:
                     import winsound
                     self.winsound = winsound
                     self.sound_available = True
+                    flags = winsound.SND_ALIAS | winsound.SND_ASYNC | winsound.SND_NODEFAULT
+                    self._critical_fn = lambda: winsound.PlaySound("SystemExclamation", flags)
+                    self._warning_fn = lambda: winsound.PlaySound("SystemAsterisk", flags)
+                    self._default_fn = lambda: winsound.PlaySound("SystemDefault", flags)
                 except ImportError:
                     self.sound_available = False
             
+            # Native Linux notifications over a reused D-Bus connection (no subprocess per popup)
+            if platform.system() == "Linux":
+                self._open_dbus_notifications()
+            
             # Cross-platform notifications
             try:
                 import plyer
@@ -119,7 +272,43 @@ class AlertManager:
                 self.pygame_sound_available = False
         
         except Exception as e:
-            self.logger.error(f"Error loading notification modules: {e}")
+            self.logger.error("Error loading notification modules: %s", e)
+    
+    def _open_dbus_notifications(self):
+        """Connect to the freedesktop notification service if jeepney and a session bus exist."""
+        try:
+            from jeepney import DBusAddress, new_method_call
+            from jeepney.io.blocking import open_dbus_connection
+        except ImportError:
+            return
+        
+        try:
+            self._dbus_conn = open_dbus_connection(bus="SESSION")
+        except Exception as e:
+            self.logger.warning("D-Bus session unavailable - using fallback popups: %s", e)
+            return
+        
+        self._dbus_address = DBusAddress("/org/freedesktop/Notifications",
+                                         bus_name="org.freedesktop.Notifications",
+                                         interface="org.freedesktop.Notifications")
+        self._dbus_new_method_call = new_method_call
+        self._dbus_lock = threading.Lock()  # the blocking connection is not thread-safe
+    
+    def _notify_dbus(self, title: str, message: str, timeout_ms: int = 10000):
+        """
+        Send a desktop notification over the persistent D-Bus connection.
+        
+        Args:
+            title (str): Notification summary
+            message (str): Notification body
+            timeout_ms (int): Display time in milliseconds
+        """
+        msg = self._dbus_new_method_call(
+            self._dbus_address, "Notify", "susssasa{sv}i",
+            ("Crowd Monitor", 0, "", title, message, [], {}, timeout_ms)
+        )
+        with self._dbus_lock:
+            self._dbus_conn.send_and_get_reply(msg, timeout=5)
     
     def check_crowd_limits(self, current_count: int) -> List[Alert]:
         """
@@ -131,35 +320,88 @@ class AlertManager:
         Returns:
             List of alerts generated
         """
-        alerts = []
+        # Most frames are below the warning threshold: nothing to build
+        if not self.alerts_enabled or current_count < self.config.WARNING_THRESHOLD:
+            return []
+        
+        return self._raise_crowd_alerts(current_count)
+    
+    def check_crowd_limits_batch(self, counts: np.ndarray, zone_ids: np.ndarray = None) -> List[Alert]:
+        """
+        Check crowd limits for several zones or cameras at once.
+        
+        Both thresholds are compared in one vectorized pass. Cooldowns are per
+        alert type, so at most one warning and one limit alert are raised per
+        call, naming the most crowded zone.
         
+        Args:
+            counts: Current number of people inside each zone
+            zone_ids: Identifier of each zone (default: its index in counts)
+            
+        Returns:
+            List of alerts generated
+        """
         if not self.alerts_enabled:
-            return alerts
+            return []
+        
+        counts = np.asarray(counts)
+        over_warning = np.flatnonzero(counts >= self.config.WARNING_THRESHOLD)
+        if over_warning.size == 0:
+            return []
+        
+        worst = over_warning[np.argmax(counts[over_warning])]
+        zone = zone_ids[worst] if zone_ids is not None else worst
+        return self._raise_crowd_alerts(int(counts[worst]), f"Zone {zone}: ")
+    
+    def _raise_crowd_alerts(self, current_count: int, label: str = "") -> List[Alert]:
+        """
+        Build and trigger the crowd alerts a count calls for, honouring cooldowns.
+        
+        Args:
+            current_count (int): Count at or above the warning threshold
+            label (str): Prefix for alert messages, e.g. the zone name
+            
+        Returns:
+            List of alerts generated
+        """
+        alerts = []
+        warn, limit = self.config.WARNING_THRESHOLD, self.config.CROWD_LIMIT
+        next_allowed = self._next_allowed
+        warn_state, limit_state = _crowd_alert_states(
+            current_count, warn, limit,
+            next_allowed.get(AlertType.CROWD_WARNING, 0.0),
+            next_allowed.get(AlertType.CROWD_LIMIT, 0.0),
+            time.monotonic()
+        )
         
         # Check warning threshold
-        if current_count >= self.config.WARNING_THRESHOLD:
-            if not self._is_in_cooldown(AlertType.CROWD_WARNING):
-                alert = Alert(
-                    alert_type=AlertType.CROWD_WARNING,
-                    message=f"Approaching capacity limit: {current_count}/{self.config.CROWD_LIMIT}",
-                    current_count=current_count,
-                    threshold=self.config.WARNING_THRESHOLD,
-                    methods=[AlertMethod.LOG, AlertMethod.OVERLAY, AlertMethod.DATABASE]
-                )
-                alerts.append(alert)
+        if warn_state == _COOLING:
+            self._suppressed_counts[AlertType.CROWD_WARNING] += 1
+        elif warn_state == _RAISE:
+            alert = Alert(
+                alert_type=AlertType.CROWD_WARNING,
+                message=self._suppressed_prefix(AlertType.CROWD_WARNING) + label +
+                        _WARN_TMPL % (current_count, limit),
+                current_count=current_count,
+                threshold=warn,
+                methods=[AlertMethod.LOG, AlertMethod.OVERLAY, AlertMethod.DATABASE]
+            )
+            alerts.append(alert)
         
         # Check critical limit
-        if current_count >= self.config.CROWD_LIMIT:
-            if not self._is_in_cooldown(AlertType.CROWD_LIMIT):
-                alert = Alert(
-                    alert_type=AlertType.CROWD_LIMIT,
-                    message=f"CROWD LIMIT EXCEEDED: {current_count}/{self.config.CROWD_LIMIT}",
-                    current_count=current_count,
-                    threshold=self.config.CROWD_LIMIT,
-                    methods=[AlertMethod.POPUP, AlertMethod.SOUND, AlertMethod.LOG, 
-                            AlertMethod.OVERLAY, AlertMethod.DATABASE]
-                )
-                alerts.append(alert)
+        if limit_state == _COOLING:
+            self._suppressed_counts[AlertType.CROWD_LIMIT] += 1
+        elif limit_state == _RAISE:
+            alert = Alert(
+                alert_type=AlertType.CROWD_LIMIT,
+                message=self._suppressed_prefix(AlertType.CROWD_LIMIT) + label +
+                        _LIMIT_TMPL % (current_count, limit),
+                current_count=current_count,
+                threshold=limit,
+                methods=[AlertMethod.POPUP, AlertMethod.SOUND, AlertMethod.LOG, 
+                        AlertMethod.OVERLAY, AlertMethod.DATABASE]
+            )
+            alerts.append(alert)
         
         # Process alerts
         for alert in alerts:
@@ -167,6 +409,19 @@ class AlertManager:
         
         return alerts
     
+    def _suppressed_prefix(self, alert_type: AlertType) -> str:
+        """
+        Report and reset how many checks the last cooldown swallowed.
+        
+        Args:
+            alert_type (AlertType): Type of alert about to be raised
+            
+        Returns:
+            Message prefix such as "(+12 suppressed) ", or "" if none were
+        """
+        suppressed = self._suppressed_counts.pop(alert_type, 0)
+        return f"(+{suppressed} suppressed) " if suppressed else ""
+    
     def trigger_alert(self, alert: Alert):
         """
         Trigger an alert using specified methods.
@@ -175,30 +430,66 @@ class AlertManager:
             alert (Alert): Alert object to process
         """
         try:
+            # Identical alerts (same type, count and message) inside the cooldown are
+            # processed once; the message keeps distinct count-less alerts apart
+            key = (alert.alert_type, alert.current_count, alert.message)
+            h = hash(key) & 8191
+            byte, bit = h >> 3, 1 << (h & 7)
+            if self._recent_bloom[byte] & bit:
+                if key in self._dedup:
+                    return
+            else:
+                self._recent_bloom[byte] |= bit
+            self._dedup[key] = 1
+            
             # Add to active alerts
             self.active_alerts.append(alert)
-            self.alert_history.append(alert)
+            self._append_history(alert)
+            if AlertMethod.OVERLAY in alert.methods and not alert.resolved:
+                self._latest_overlay = alert
+                self._overlay_stale = False
             
-            # Update last alert time
+            # Update last alert time and start the cooldown window
             self.last_alert_times[alert.alert_type] = alert.timestamp
+            self._next_allowed[alert.alert_type] = time.monotonic() + self.alert_cooldown
             
             # Process each alert method
             for method in alert.methods:
                 self._process_alert_method(alert, method)
             
-            # Execute registered callbacks
-            if alert.alert_type in self.alert_callbacks:
-                for callback in self.alert_callbacks[alert.alert_type]:
-                    try:
-                        callback(alert)
-                    except Exception as e:
-                        self.logger.error(f"Error in alert callback: {e}")
+            # Execute registered callbacks; the tuple is immutable, so a concurrent
+            # register_callback cannot change it mid-iteration
+            first_error, failed = None, 0
+            for callback in self.alert_callbacks.get(alert.alert_type, ()):
+                try:
+                    callback(alert)
+                except Exception as e:
+                    failed += 1
+                    if first_error is None:
+                        first_error = e
+            
+            if failed:
+                self.callback_errors += failed
+                self.logger.error("Error in alert callback: %s (%s failed)", first_error, failed)
             
             # Clean up old alerts
             self._cleanup_old_alerts()
         
         except Exception as e:
-            self.logger.error(f"Error triggering alert: {e}")
+            self.logger.error("Error triggering alert: %s", e)
+    
+    def _append_history(self, alert: Alert):
+        """
+        Append to the bounded history, keeping per-type counts in step with evictions.
+        
+        Args:
+            alert (Alert): Alert object
+        """
+        history = self.alert_history
+        if len(history) == history.maxlen:
+            self._type_counts[history[0].alert_type.label] -= 1
+        history.append(alert)
+        self._type_counts[alert.alert_type.label] += 1
     
     def _process_alert_method(self, alert: Alert, method: AlertMethod):
         """
@@ -209,32 +500,78 @@ class AlertManager:
             method (AlertMethod): Alert method to use
         """
         try:
-            if method == AlertMethod.LOG:
-                log_alert(self.logger, alert.alert_type.value, 
-                         alert.current_count or 0, alert.threshold or 0)
-            
-            elif method == AlertMethod.DATABASE:
-                self.db_manager.log_alert(
-                    alert_type=alert.alert_type.value,
-                    current_count=alert.current_count or 0,
-                    threshold=alert.threshold or 0,
-                    notes=alert.message
-                )
-            
-            elif method == AlertMethod.POPUP:
-                if self.popup_alerts:
-                    self._show_popup_notification(alert)
+            self._method_dispatch[method](alert)
+        except Exception as e:
+            self.logger.error("Error processing alert method %s: %s", method.label, e)
+    
+    def _build_method_dispatch(self):
+        """Map each alert method to its handler, honouring the popup and sound settings."""
+        def skip(alert: Alert):
+            pass
+        
+        self._method_dispatch = {
+            AlertMethod.LOG: self._log_alert,
+            AlertMethod.DATABASE: self._queue_db_alert,
+            AlertMethod.POPUP: self._show_popup_notification if self.popup_alerts else skip,
+            AlertMethod.SOUND: self._play_sound_alert if self.sound_alerts else skip,
+            # Overlay alerts are handled by the video overlay system
+            AlertMethod.OVERLAY: skip,
+        }
+    
+    def _log_alert(self, alert: Alert):
+        """
+        Write an alert to the application log.
+        
+        Args:
+            alert (Alert): Alert object
+        """
+        log_alert(self.logger, alert.alert_type.label, 
+                 alert.current_count or 0, alert.threshold or 0)
+    
+    def _queue_db_alert(self, alert: Alert):
+        """
+        Queue an alert row for the database flusher.
+        
+        Args:
+            alert (Alert): Alert object
+        """
+        try:
+            self._db_queue.put_nowait((
+                alert.timestamp,
+                alert.alert_type.label,
+                alert.current_count or 0,
+                alert.threshold or 0,
+                alert.message
+            ))
+        except queue.Full:
+            self.logger.warning("Alert database queue full - alert not recorded")
+    
+    def _db_flusher(self):
+        """Drain queued alert rows and insert each batch in a single transaction."""
+        while True:
+            rows = [self._db_queue.get()]
+            deadline = time.monotonic() + self.DB_FLUSH_INTERVAL
             
-            elif method == AlertMethod.SOUND:
-                if self.sound_alerts:
-                    self._play_sound_alert(alert)
+            while len(rows) < self.DB_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    rows.append(self._db_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
             
-            elif method == AlertMethod.OVERLAY:
-                # Overlay alerts are handled by the video overlay system
-                pass
-        
-        except Exception as e:
-            self.logger.error(f"Error processing alert method {method}: {e}")
+            try:
+                self.db_manager.log_alerts_bulk(rows)
+            except Exception as e:
+                self.logger.error("Error writing alerts to database: %s", e)
+            finally:
+                for _ in rows:
+                    self._db_queue.task_done()
+    
+    def flush(self):
+        """Block until every alert queued for the database has been written."""
+        self._db_queue.join()
     
     def _show_popup_notification(self, alert: Alert):
         """
@@ -245,10 +582,12 @@ class AlertManager:
         """
         def show_notification():
             try:
-                if self.notification_available:
+                title = f"Crowd Monitor - {alert.alert_type.label.title()}"
+                
+                if self._dbus_conn is not None:
+                    self._notify_dbus(title, alert.message)
+                elif self.notification_available:
                     # Use plyer for cross-platform notifications
-                    title = f"Crowd Monitor - {alert.alert_type.value.title()}"
-                    
                     self.plyer_notification.notify(
                         title=title,
                         message=alert.message,
@@ -257,16 +596,13 @@ class AlertManager:
                     )
                 else:
                     # Fallback to simple print/log
-                    self.logger.info(f"POPUP ALERT: {alert.message}")
+                    self.logger.info("POPUP ALERT: %s", alert.message)
             
             except Exception as e:
-                self.logger.error(f"Error showing popup notification: {e}")
+                self.logger.error("Error showing popup notification: %s", e)
         
-        # Run in separate thread to avoid blocking
-        thread = threading.Thread(target=show_notification)
-        thread.daemon = True
-        thread.start()
-        self.alert_thread_pool.append(thread)
+        # Run on the notifier pool to avoid blocking
+        self._notifier_exec.submit(show_notification)
     
     def _play_sound_alert(self, alert: Alert):
         """
@@ -275,61 +611,32 @@ class AlertManager:
         Args:
             alert (Alert): Alert object
         """
-        def play_sound():
-            try:
-                if alert.alert_type == AlertType.CROWD_LIMIT:
-                    # Critical alert sound
-                    self._play_critical_sound()
-                elif alert.alert_type == AlertType.CROWD_WARNING:
-                    # Warning alert sound
-                    self._play_warning_sound()
-                else:
-                    # Default alert sound
-                    self._play_default_sound()
-            
-            except Exception as e:
-                self.logger.error(f"Error playing sound alert: {e}")
+        # System sounds are played with SND_ASYNC, so no worker thread is needed
+        try:
+            if alert.alert_type == AlertType.CROWD_LIMIT:
+                # Critical alert sound
+                self._play_critical_sound()
+            elif alert.alert_type == AlertType.CROWD_WARNING:
+                # Warning alert sound
+                self._play_warning_sound()
+            else:
+                # Default alert sound
+                self._play_default_sound()
         
-        # Run in separate thread
-        thread = threading.Thread(target=play_sound)
-        thread.daemon = True
-        thread.start()
-        self.alert_thread_pool.append(thread)
+        except Exception as e:
+            self.logger.error("Error playing sound alert: %s", e)
     
     def _play_critical_sound(self):
         """Play critical alert sound."""
-        if platform.system() == "Windows" and self.sound_available:
-            # Use Windows system sounds
-            import winsound
-            winsound.PlaySound("SystemExclamation", winsound.SND_ALIAS)
-        elif self.pygame_sound_available:
-            # Use pygame to play custom sound
-            # Could load custom alert sound files here
-            pass
-        else:
-            # Fallback - system beep
-            if platform.system() == "Windows":
-                import winsound
-                for _ in range(3):
-                    winsound.Beep(1000, 500)
-                    time.sleep(0.1)
+        self._critical_fn()
     
     def _play_warning_sound(self):
         """Play warning alert sound."""
-        if platform.system() == "Windows" and self.sound_available:
-            import winsound
-            winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS)
-        else:
-            # Fallback - single beep
-            if platform.system() == "Windows":
-                import winsound
-                winsound.Beep(800, 300)
+        self._warning_fn()
     
     def _play_default_sound(self):
         """Play default alert sound."""
-        if platform.system() == "Windows" and self.sound_available:
-            import winsound
-            winsound.PlaySound("SystemDefault", winsound.SND_ALIAS)
+        self._default_fn()
     
     def _is_in_cooldown(self, alert_type: AlertType) -> bool:
         """
@@ -341,34 +648,39 @@ class AlertManager:
         Returns:
             True if in cooldown, False otherwise
         """
-        if alert_type not in self.last_alert_times:
-            return False
-        
-        last_alert = self.last_alert_times[alert_type]
-        elapsed = (datetime.now() - last_alert).total_seconds()
-        
-        return elapsed < self.alert_cooldown
+        return time.monotonic() < self._next_allowed.get(alert_type, 0.0)
     
     def _cleanup_old_alerts(self):
         """Remove old alerts from active list."""
-        current_time = datetime.now()
-        cutoff_time = current_time - timedelta(minutes=5)  # Keep alerts for 5 minutes
-        
-        # Remove old active alerts
-        self.active_alerts = [
-            alert for alert in self.active_alerts
-            if alert.timestamp > cutoff_time
-        ]
-        
-        # Limit history size
-        if len(self.alert_history) > 100:
-            self.alert_history = self.alert_history[-50:]
+        cutoff_time = time.monotonic() - 300  # Keep alerts for 5 minutes
+        
+        # Remove old active alerts (history is bounded by its deque maxlen)
+        active_alerts = self.active_alerts
+        while active_alerts and active_alerts[0]._mono_ts <= cutoff_time:
+            if active_alerts.popleft() is self._latest_overlay:
+                self._overlay_stale = True
+        
+        # Evict expired fingerprints in one pass rather than on every lookup
+        self._dedup.expire()
+        
+        # Periodically rebuild the bloom filter from the keys still cached
+        now = time.monotonic()
+        if now >= self._bloom_reset_at:
+            self._reset_bloom(self._dedup)
+            self._bloom_reset_at = now + max(1, self.alert_cooldown)
+    
+    def _reset_bloom(self, keys=()):
+        """
+        Clear the dedup bloom filter and re-mark the given keys.
         
-        # Clean up finished threads
-        self.alert_thread_pool = [
-            thread for thread in self.alert_thread_pool
-            if thread.is_alive()
-        ]
+        Args:
+            keys: Fingerprints that must keep their bits set
+        """
+        bloom = bytearray(1024)
+        for key in keys:
+            h = hash(key) & 8191
+            bloom[h >> 3] |= 1 << (h & 7)
+        self._recent_bloom = bloom
     
     def register_callback(self, alert_type: AlertType, callback: Callable):
         """
@@ -378,11 +690,9 @@ class AlertManager:
             alert_type (AlertType): Type of alert to listen for
             callback (Callable): Function to call when alert occurs
         """
-        if alert_type not in self.alert_callbacks:
-            self.alert_callbacks[alert_type] = []
-        
-        self.alert_callbacks[alert_type].append(callback)
-        self.logger.info(f"Registered callback for alert type: {alert_type}")
+        # Swap in a new tuple so readers never see a list being mutated
+        self.alert_callbacks[alert_type] = self.alert_callbacks.get(alert_type, ()) + (callback,)
+        self.logger.info("Registered callback for alert type: %s", alert_type.label)
     
     def get_active_alerts(self) -> List[Alert]:
         """
@@ -391,7 +701,7 @@ class AlertManager:
         Returns:
             List of active alerts
         """
-        return self.active_alerts.copy()
+        return list(self.active_alerts)
     
     def get_latest_overlay_alert(self) -> Optional[Alert]:
         """
@@ -400,15 +710,16 @@ class AlertManager:
         Returns:
             Most recent alert suitable for overlay, or None
         """
-        overlay_alerts = [
-            alert for alert in self.active_alerts
-            if AlertMethod.OVERLAY in alert.methods and not alert.resolved
-        ]
-        
-        if overlay_alerts:
-            return max(overlay_alerts, key=lambda x: x.timestamp)
-        
-        return None
+        if self._overlay_stale:
+            # The tracked alert was resolved or expired; rescan once for its successor
+            overlay_alerts = [
+                alert for alert in self.active_alerts
+                if AlertMethod.OVERLAY in alert.methods and not alert.resolved
+            ]
+            self._latest_overlay = max(overlay_alerts, key=lambda x: x.timestamp) if overlay_alerts else None
+            self._overlay_stale = False
+        
+        return self._latest_overlay
     
     def resolve_alert(self, alert: Alert):
         """
@@ -423,6 +734,9 @@ class AlertManager:
         # Remove from active alerts
         if alert in self.active_alerts:
             self.active_alerts.remove(alert)
+        
+        if alert is self._latest_overlay:
+            self._overlay_stale = True
     
     def clear_all_alerts(self):
         """Clear all active alerts."""
@@ -431,6 +745,8 @@ class AlertManager:
             alert.resolved_timestamp = datetime.now()
         
         self.active_alerts.clear()
+        self._latest_overlay = None
+        self._overlay_stale = False
         self.logger.info("All alerts cleared")
     
     def update_settings(self, alerts_enabled: bool = None, sound_alerts: bool = None,
@@ -446,19 +762,24 @@ class AlertManager:
         """
         if alerts_enabled is not None:
             self.alerts_enabled = alerts_enabled
-            self.logger.info(f"Alerts enabled: {alerts_enabled}")
+            self.logger.info("Alerts enabled: %s", alerts_enabled)
         
         if sound_alerts is not None:
             self.sound_alerts = sound_alerts
-            self.logger.info(f"Sound alerts enabled: {sound_alerts}")
+            self.logger.info("Sound alerts enabled: %s", sound_alerts)
         
         if popup_alerts is not None:
             self.popup_alerts = popup_alerts
-            self.logger.info(f"Popup alerts enabled: {popup_alerts}")
+            self.logger.info("Popup alerts enabled: %s", popup_alerts)
+        
+        if sound_alerts is not None or popup_alerts is not None:
+            self._build_method_dispatch()
         
         if alert_cooldown is not None:
             self.alert_cooldown = alert_cooldown
-            self.logger.info(f"Alert cooldown set to: {alert_cooldown} seconds")
+            self._dedup = _create_dedup_cache(alert_cooldown)
+            self._reset_bloom()
+            self.logger.info("Alert cooldown set to: %s seconds", alert_cooldown)
     
     def get_alert_statistics(self) -> Dict[str, Any]:
         """
@@ -470,11 +791,8 @@ class AlertManager:
         total_alerts = len(self.alert_history)
         active_alerts = len(self.active_alerts)
         
-        # Count by type
-        alert_counts = {}
-        for alert in self.alert_history:
-            alert_type = alert.alert_type.value
-            alert_counts[alert_type] = alert_counts.get(alert_type, 0) + 1
+        # Count by type (maintained incrementally; unary + drops types no longer in history)
+        alert_counts = dict(+self._type_counts)
         
         return {
             'total_alerts': total_alerts,
@@ -485,6 +803,14 @@ class AlertManager:
             'popup_enabled': self.popup_alerts,
             'cooldown_period': self.alert_cooldown
         }
+    
+    def shutdown(self):
+        """
+        Write queued alerts to the database and stop accepting notification work;
+        queued popups and sounds are abandoned.
+        """
+        self.flush()
+        self._notifier_exec.shutdown(wait=False)
 
 
 def create_alert_manager() -> AlertManager:
@@ -6,10 +6,20 @@ Implements virtual line crossing detection to count entries and exits.
 import cv2
 import numpy as np
 import logging
+import queue
+import threading
+from collections import deque
+from itertools import islice
 from typing import Dict, List, Tuple, Optional, Set
 from enum import Enum
 from datetime import datetime
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
 from utils.config import get_config
 from utils.logger import default_logger, log_detection_event
 from src.database import get_database_manager
@@ -22,9 +32,91 @@ class CrossingDirection(Enum):
     NONE = "none"
 
 
+def _crossing_direction(px: int, py: int, cx: int, cy: int, x3: int, y3: int,
+                        x4: int, y4: int, entry_sign: int) -> int:
+    """
+    Scalar crossing test for one move, compiled with Numba when available.
+    
+    Args:
+        px, py (int): Previous centroid
+        cx, cy (int): Current centroid
+        x3, y3, x4, y4 (int): Counting line endpoints
+        entry_sign (int): Side of the line (+1/-1) that counts as inside
+        
+    Returns:
+        +1 for an entry, -1 for an exit and 0 for no crossing
+    """
+    # Bounding box of the move must overlap the line's
+    if (max(px, cx) < min(x3, x4) or min(px, cx) > max(x3, x4) or
+            max(py, cy) < min(y3, y4) or min(py, cy) > max(y3, y4)):
+        return 0
+    
+    # Strictly opposite sides of the line
+    dx = x4 - x3
+    dy = y4 - y3
+    s_prev = dx * (py - y3) - dy * (px - x3)
+    s_curr = dx * (cy - y3) - dy * (cx - x3)
+    if s_prev == 0 or s_curr == 0 or (s_prev > 0) == (s_curr > 0):
+        return 0
+    
+    # Line endpoints on opposite sides of (or on) the trajectory
+    mx = cx - px
+    my = cy - py
+    start_side = mx * (y3 - py) - my * (x3 - px)
+    end_side = mx * (y4 - py) - my * (x4 - px)
+    if (start_side > 0 and end_side > 0) or (start_side < 0 and end_side < 0):
+        return 0
+    
+    return 1 if s_curr * entry_sign > 0 else -1
+
+
+def _crossing_directions(prev: np.ndarray, curr: np.ndarray, x3: int, y3: int,
+                         x4: int, y4: int, entry_sign: int) -> np.ndarray:
+    """
+    Run the crossing test for every object.
+    
+    Args:
+        prev (np.ndarray): (N, 2) previous centroids
+        curr (np.ndarray): (N, 2) current centroids
+        x3, y3, x4, y4 (int): Counting line endpoints
+        entry_sign (int): Side of the line (+1/-1) that counts as inside
+        
+    Returns:
+        int8 array with +1 for an entry, -1 for an exit and 0 for no crossing
+    """
+    n = prev.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in range(n):
+        out[i] = _crossing_direction(prev[i, 0], prev[i, 1], curr[i, 0], curr[i, 1],
+                                     x3, y3, x4, y4, entry_sign)
+    return out
+
+
+def _crossing_directions_parallel(prev: np.ndarray, curr: np.ndarray, x3: int, y3: int,
+                                  x4: int, y4: int, entry_sign: int) -> np.ndarray:
+    """Same as _crossing_directions, with the objects split across threads."""
+    n = prev.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+    for i in prange(n):
+        out[i] = _crossing_direction(prev[i, 0], prev[i, 1], curr[i, 0], curr[i, 1],
+                                     x3, y3, x4, y4, entry_sign)
+    return out
+
+
+# Without Numba the vectorized NumPy path in PeopleCounter is used instead
+if njit is not None:
+    _crossing_direction = njit(cache=True)(_crossing_direction)
+    _crossing_kernel = njit(cache=True)(_crossing_directions)
+    _parallel_crossing_kernel = njit(cache=True, parallel=True)(_crossing_directions_parallel)
+else:
+    _crossing_kernel = _parallel_crossing_kernel = None
+
+
 class LineCrossing:
     """Represents a line crossing event."""
     
+    __slots__ = ('object_id', 'direction', 'timestamp', 'crossing_point')
+    
     def __init__(self, object_id: int, direction: CrossingDirection, 
                  timestamp: datetime, crossing_point: Tuple[int, int]):
         self.object_id = object_id
@@ -38,6 +130,15 @@ class PeopleCounter:
     Implements line-crossing based people counting with entry/exit detection.
     """
     
+    # Position rows allocated up front; doubled whenever more objects are tracked at once
+    INITIAL_ROWS = 64
+    
+    # Objects unseen for this many frames are dropped; the sweep runs once per this many frames
+    STALE_FRAMES = 30
+    
+    # Scenes with at least this many tracked objects use the multi-threaded kernel
+    PARALLEL_MIN_OBJECTS = 256
+    
     def __init__(self, counting_line: Dict = None, logger: logging.Logger = None):
         """
         Initialize the people counter.
@@ -53,19 +154,37 @@ class PeopleCounter:
         # Counting line configuration
         self.counting_line = counting_line or self.config.COUNTING_LINE
         
+        # Side of the line an entering object ends up on (sign of the side cross product)
+        self._entry_sign = -1 if self.config.ENTRY_DIRECTION == "right_to_left" else 1
+        
+        # Pixel line coordinates, recomputed only when frame size or config changes
+        self._line_cache_key = None
+        self._line_coords = None
+        
         # Counting state
         self.count_inside = 0
         self.total_entered = 0
         self.total_exited = 0
         
-        # Tracking state for line crossing detection
-        self.object_positions = {}  # {object_id: [list of positions]}
-        self.crossed_objects = set()  # Objects that have already crossed (to prevent double counting)
-        self.crossing_buffer = 5  # Number of frames to track for crossing detection
+        # Tracking state for line crossing detection: only the previous and current
+        # centroid are ever compared, so each object owns one row of a (rows, 2, 2) array
+        self._positions = np.zeros((self.INITIAL_ROWS, 2, 2), dtype=np.int32)  # [row, prev/curr, x/y], pixels
+        self._row_of = {}  # {object_id: row in _positions}
+        self._free_rows = []  # rows released by objects that left
+        self._next_row = 0  # first never-used row
+        self._last_seen = {}  # {object_id: frame index}
+        self._frame_idx = 0
+        self._has_crossed = np.zeros(self.INITIAL_ROWS, dtype=bool)  # per row: already counted (prevents double counting)
         
         # Line crossing events history
-        self.recent_crossings = []
         self.max_history = 100
+        self.recent_crossings = deque(maxlen=self.max_history)
+        
+        # Crossing events are collected per frame and written by a background thread
+        self._pending_events = []
+        self._event_q = queue.Queue()
+        self._event_thread = threading.Thread(target=self._event_writer, daemon=True)
+        self._event_thread.start()
         
         # Load current counts from database
         self._load_current_counts()
@@ -95,185 +214,273 @@ class PeopleCounter:
         Returns:
             List of LineCrossing events detected in this update
         """
-        crossings = []
-        
         # Get line coordinates in pixel values
-        line_start, line_end = self.config.get_counting_line_coords(frame_width, frame_height)
-        
-        # Process each tracked object
-        for object_id, obj_data in tracked_objects.items():
-            centroid = obj_data['centroid']
-            
-            # Update position history for this object
-            if object_id not in self.object_positions:
-                self.object_positions[object_id] = []
-            
-            self.object_positions[object_id].append(centroid)
-            
-            # Keep only recent positions
-            if len(self.object_positions[object_id]) > self.crossing_buffer:
-                self.object_positions[object_id] = self.object_positions[object_id][-self.crossing_buffer:]
+        line_start, line_end = self._get_line_coords(frame_width, frame_height)
+        
+        # Shift each object's current centroid to previous and store the new one;
+        # unseen objects start with previous == current, which can never cross
+        object_ids = list(tracked_objects.keys())
+        curr = np.array([obj['centroid'] for obj in tracked_objects.values()],
+                        dtype=np.int32).reshape(-1, 2)
+        rows = np.fromiter((self._row_for(object_id, curr[i]) for i, object_id in enumerate(object_ids)),
+                           dtype=np.intp, count=len(object_ids))
+        
+        positions = self._positions
+        positions[rows, 0] = positions[rows, 1]
+        positions[rows, 1] = curr
+        prev = positions[rows, 0]
+        
+        # Most frames have nothing near the line: skip the per-crossing work entirely
+        found = self._find_crossings(prev, curr, line_start, line_end, rows)
+        if not found:
+            self._update_history(object_ids)
+            return []
+        
+        # Only the (usually few) crossing objects are handled in Python;
+        # they all happened in this frame and share one timestamp
+        now = datetime.now()
+        crossings = []
+        for i, direction, crossing_point in found:
+            object_id = object_ids[i]
+            crossing = LineCrossing(
+                object_id=object_id,
+                direction=direction,
+                timestamp=now,
+                crossing_point=crossing_point
+            )
+            crossings.append(crossing)
+            self._process_crossing(crossing)
             
-            # Check for line crossing
-            if len(self.object_positions[object_id]) >= 2:
-                crossing = self._detect_line_crossing(
-                    object_id, 
-                    self.object_positions[object_id],
-                    line_start, 
-                    line_end
-                )
-                
-                if crossing and object_id not in self.crossed_objects:
-                    crossings.append(crossing)
-                    self._process_crossing(crossing)
-                    
-                    # Mark object as crossed to prevent double counting
-                    self.crossed_objects.add(object_id)
-        
-        # Clean up old object positions for objects that are no longer tracked
-        current_object_ids = set(tracked_objects.keys())
-        old_object_ids = set(self.object_positions.keys()) - current_object_ids
-        
-        for old_id in old_object_ids:
-            del self.object_positions[old_id]
-            self.crossed_objects.discard(old_id)
+            # Mark object as crossed to prevent double counting
+            self._has_crossed[rows[i]] = True
         
+        # Hand this frame's events to the database writer in one batch
+        if self._pending_events:
+            self._event_q.put(self._pending_events)
+            self._pending_events = []
+        
+        self._update_history(object_ids)
         return crossings
     
-    def _detect_line_crossing(self, object_id: int, positions: List[Tuple[int, int]], 
-                            line_start: Tuple[int, int], line_end: Tuple[int, int]) -> Optional[LineCrossing]:
+    def _update_history(self, object_ids: List[int]):
         """
-        Detect if an object has crossed the counting line.
+        Record the objects seen this frame and periodically release stale rows.
         
         Args:
-            object_id (int): ID of the tracked object
-            positions (List[Tuple[int, int]]): Recent positions of the object
-            line_start (Tuple[int, int]): Start point of counting line
-            line_end (Tuple[int, int]): End point of counting line
-            
-        Returns:
-            LineCrossing event if crossing detected, None otherwise
+            object_ids (List[int]): IDs of the objects tracked in this frame
         """
-        if len(positions) < 2:
-            return None
-        
-        # Check the last two positions for line crossing
-        prev_pos = positions[-2]
-        curr_pos = positions[-1]
-        
-        # Check if the object trajectory intersects with the counting line
-        intersection = self._line_intersection(prev_pos, curr_pos, line_start, line_end)
+        self._frame_idx += 1
+        self._last_seen.update(dict.fromkeys(object_ids, self._frame_idx))
+        if self._frame_idx % self.STALE_FRAMES == 0:
+            self._release_stale_objects()
+    
+    def _release_stale_objects(self):
+        """Free the rows of objects not seen in the last STALE_FRAMES frames."""
+        cutoff = self._frame_idx - self.STALE_FRAMES
+        stale_ids = [object_id for object_id, seen in self._last_seen.items() if seen <= cutoff]
+        
+        for old_id in stale_ids:
+            del self._last_seen[old_id]
+            self._free_rows.append(self._row_of.pop(old_id))
+    
+    def _get_line_coords(self, frame_width: int, frame_height: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Get the counting line in pixels, cached per frame size and config version.
         
-        if intersection:
-            # Determine crossing direction based on object movement
-            direction = self._determine_crossing_direction(prev_pos, curr_pos, line_start, line_end)
+        Args:
+            frame_width (int): Width of video frame
+            frame_height (int): Height of video frame
             
-            if direction != CrossingDirection.NONE:
-                return LineCrossing(
-                    object_id=object_id,
-                    direction=direction,
-                    timestamp=datetime.now(),
-                    crossing_point=intersection
-                )
-        
-        return None
+        Returns:
+            Tuple of start and end coordinates as pixel values
+        """
+        key = (frame_width, frame_height, self.config.get_version())
+        if key != self._line_cache_key:
+            self._line_coords = self.config.get_counting_line_coords(frame_width, frame_height)
+            self._line_cache_key = key
+        return self._line_coords
     
-    def _line_intersection(self, p1: Tuple[int, int], p2: Tuple[int, int], 
-                          p3: Tuple[int, int], p4: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+    def _row_for(self, object_id: int, centroid: np.ndarray) -> int:
         """
-        Check if two line segments intersect and return intersection point.
+        Get the position row of an object, allocating one for a new object.
         
         Args:
-            p1, p2: Points defining the first line segment (object trajectory)
-            p3, p4: Points defining the second line segment (counting line)
+            object_id (int): ID of the tracked object
+            centroid (np.ndarray): Current centroid, stored as a new object's latest position
             
         Returns:
-            Intersection point if lines intersect, None otherwise
+            Row index into the position array
         """
-        x1, y1 = p1
-        x2, y2 = p2
-        x3, y3 = p3
-        x4, y4 = p4
+        row = self._row_of.get(object_id)
+        if row is not None:
+            return row
         
-        # Calculate the direction vectors
-        denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            row = self._next_row
+            self._next_row += 1
+            if row == len(self._positions):
+                self._positions = np.concatenate([self._positions, np.zeros_like(self._positions)])
+                self._has_crossed = np.concatenate([self._has_crossed, np.zeros_like(self._has_crossed)])
+        
+        self._positions[row, 1] = centroid
+        self._has_crossed[row] = False
+        self._row_of[object_id] = row
+        return row
+    
+    def _clear_tracking(self):
+        """Forget all tracked positions and crossed flags."""
+        self._row_of.clear()
+        self._free_rows.clear()
+        self._next_row = 0
+        self._last_seen.clear()
+        self._has_crossed[:] = False
+    
+    def _find_crossings(self, prev: np.ndarray, curr: np.ndarray,
+                        line_start: Tuple[int, int], line_end: Tuple[int, int],
+                        rows: Optional[np.ndarray] = None) -> List[Tuple[int, CrossingDirection, Tuple[int, int]]]:
+        """
+        Find every object whose last move crossed the counting line.
         
-        # Lines are parallel
-        if abs(denom) < 1e-6:
-            return None
+        Uses the compiled kernel when Numba is installed, otherwise one
+        vectorized NumPy pass.
         
-        # Calculate intersection parameters
-        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-        u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denom
+        Args:
+            prev (np.ndarray): (N, 2) previous centroids
+            curr (np.ndarray): (N, 2) current centroids
+            line_start (Tuple[int, int]): Start point of counting line
+            line_end (Tuple[int, int]): End point of counting line
+            rows (np.ndarray): Position rows of the objects; objects already counted are skipped
+            
+        Returns:
+            List of (row index, direction, crossing point) for each crossing
+        """
+        if len(curr) == 0:
+            return []
+        
+        if _crossing_kernel is not None:
+            # Thread start-up outweighs the work for typical scenes
+            kernel = _parallel_crossing_kernel if len(curr) >= self.PARALLEL_MIN_OBJECTS else _crossing_kernel
+            directions = kernel(prev, curr, line_start[0], line_start[1],
+                                line_end[0], line_end[1], self._entry_sign)
+            hits = np.flatnonzero(directions)
+            entering = directions[hits] > 0
+        else:
+            hits, entering = self._vectorized_crossings(prev, curr, line_start, line_end)
+        
+        if rows is not None and hits.size:
+            new = ~self._has_crossed[rows[hits]]
+            hits, entering = hits[new], entering[new]
         
-        # Check if intersection point is within both line segments
-        if 0 <= t <= 1 and 0 <= u <= 1:
-            # Calculate intersection point
-            ix = int(x1 + t * (x2 - x1))
-            iy = int(y1 + t * (y2 - y1))
-            return (ix, iy)
+        results = []
+        for j, index in enumerate(hits):
+            direction = CrossingDirection.ENTRY if entering[j] else CrossingDirection.EXIT
+            # Midpoint of the move: within a frame's displacement of the true intersection
+            crossing_point = (int(prev[index, 0] + curr[index, 0]) // 2,
+                              int(prev[index, 1] + curr[index, 1]) // 2)
+            results.append((int(index), direction, crossing_point))
         
-        return None
+        return results
     
-    def _determine_crossing_direction(self, prev_pos: Tuple[int, int], curr_pos: Tuple[int, int],
-                                   line_start: Tuple[int, int], line_end: Tuple[int, int]) -> CrossingDirection:
+    def _vectorized_crossings(self, prev: np.ndarray, curr: np.ndarray,
+                              line_start: Tuple[int, int], line_end: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Determine the direction of crossing based on object movement and line orientation.
+        NumPy version of the crossing test, used when Numba is not installed.
+        
+        The two side-of-line cross products per object decide both whether the
+        object crossed and in which direction; only straddling objects also get
+        the trajectory-vs-line-endpoint test.
         
         Args:
-            prev_pos, curr_pos: Previous and current object positions
-            line_start, line_end: Start and end points of counting line
+            prev (np.ndarray): (N, 2) previous centroids
+            curr (np.ndarray): (N, 2) current centroids
+            line_start (Tuple[int, int]): Start point of counting line
+            line_end (Tuple[int, int]): End point of counting line
             
         Returns:
-            CrossingDirection indicating entry, exit, or none
+            Tuple of crossing row indices and a matching boolean array, True for entries
         """
-        # Calculate which side of the line each position is on
-        prev_side = self._point_side_of_line(prev_pos, line_start, line_end)
-        curr_side = self._point_side_of_line(curr_pos, line_start, line_end)
-        
-        # If positions are on different sides, a crossing occurred
-        if prev_side != curr_side and prev_side != 0 and curr_side != 0:
-            # Determine direction based on configuration and line orientation
-            if self.config.ENTRY_DIRECTION == "right_to_left":
-                # Entry is from positive to negative side (right to left)
-                if prev_side > 0 and curr_side < 0:
-                    return CrossingDirection.ENTRY
-                elif prev_side < 0 and curr_side > 0:
-                    return CrossingDirection.EXIT
-            else:  # "left_to_right"
-                # Entry is from negative to positive side (left to right)
-                if prev_side < 0 and curr_side > 0:
-                    return CrossingDirection.ENTRY
-                elif prev_side > 0 and curr_side < 0:
-                    return CrossingDirection.EXIT
-        
-        return CrossingDirection.NONE
+        none = (np.empty(0, dtype=np.intp), np.empty(0, dtype=bool))
+        x3, y3 = line_start
+        x4, y4 = line_end
+        dx, dy = x4 - x3, y4 - y3
+        px, py = prev[:, 0], prev[:, 1]
+        cx, cy = curr[:, 0], curr[:, 1]
+        
+        # A move can only cross the line if its bounding box overlaps the line's;
+        # most objects are far from the line and are rejected here
+        near = np.flatnonzero(
+            (np.maximum(px, cx) >= min(x3, x4)) & (np.minimum(px, cx) <= max(x3, x4)) &
+            (np.maximum(py, cy) >= min(y3, y4)) & (np.minimum(py, cy) <= max(y3, y4))
+        )
+        if near.size == 0:
+            return none
+        px, py, cx, cy = px[near], py[near], cx[near], cy[near]
+        
+        # Side of the line for each position: positive right/above, negative left/below.
+        # Horizontal and vertical lines (the usual setup) only need one coordinate;
+        # `orient` restores the sign the full cross product would have had
+        if dy == 0 and dx != 0:
+            s_prev, s_curr = py - y3, cy - y3
+            orient = 1 if dx > 0 else -1
+        elif dx == 0 and dy != 0:
+            s_prev, s_curr = px - x3, cx - x3
+            orient = -1 if dy > 0 else 1
+        else:
+            s_prev = dx * (py - y3) - dy * (px - x3)
+            s_curr = dx * (cy - y3) - dy * (cx - x3)
+            orient = 1
+        
+        # Strictly opposite sides (a position on the line does not count); compare
+        # signs rather than multiplying, as the product can overflow int32
+        candidates = np.flatnonzero(np.sign(s_prev) * np.sign(s_curr) < 0)
+        if candidates.size == 0:
+            return none
+        
+        # The positions straddle the line; the segments cross if the line's endpoints
+        # also lie on opposite sides of (or on) the trajectory prev->curr
+        px, py, cx, cy = px[candidates], py[candidates], cx[candidates], cy[candidates]
+        start_side = np.sign((cx - px) * (y3 - py) - (cy - py) * (x3 - px))
+        end_side = np.sign((cx - px) * (y4 - py) - (cy - py) * (x4 - px))
+        hits = np.flatnonzero(start_side * end_side <= 0)
+        
+        entering = (s_curr[candidates[hits]] * (self._entry_sign * orient)) > 0
+        return near[candidates[hits]], entering
     
-    def _point_side_of_line(self, point: Tuple[int, int], line_start: Tuple[int, int], 
-                          line_end: Tuple[int, int]) -> int:
+    def _detect_line_crossing(self, object_id: int, positions: List[Tuple[int, int]], 
+                            line_start: Tuple[int, int], line_end: Tuple[int, int],
+                            timestamp: Optional[datetime] = None) -> Optional[LineCrossing]:
         """
-        Determine which side of a line a point is on.
+        Detect if an object has crossed the counting line.
         
         Args:
-            point: Point to test
-            line_start, line_end: Line definition points
+            object_id (int): ID of the tracked object
+            positions (List[Tuple[int, int]]): Recent positions of the object
+            line_start (Tuple[int, int]): Start point of counting line
+            line_end (Tuple[int, int]): End point of counting line
+            timestamp (datetime): Frame time for the event (defaults to now)
             
         Returns:
-            Positive if point is on right/above, negative if left/below, 0 if on line
+            LineCrossing event if crossing detected, None otherwise
         """
-        px, py = point
-        x1, y1 = line_start
-        x2, y2 = line_end
+        if len(positions) < 2:
+            return None
         
-        # Use cross product to determine side
-        cross_product = (x2 - x1) * (py - y1) - (y2 - y1) * (px - x1)
+        # Check the last two positions for line crossing
+        found = self._find_crossings(np.array([positions[-2]], dtype=np.int32),
+                                     np.array([positions[-1]], dtype=np.int32),
+                                     line_start, line_end)
+        if not found:
+            return None
         
-        if cross_product > 0:
-            return 1
-        elif cross_product < 0:
-            return -1
-        else:
-            return 0
+        _, direction, crossing_point = found[0]
+        return LineCrossing(
+            object_id=object_id,
+            direction=direction,
+            timestamp=timestamp or datetime.now(),
+            crossing_point=crossing_point
+        )
     
     def _process_crossing(self, crossing: LineCrossing):
         """
@@ -282,44 +489,53 @@ class PeopleCounter:
         Args:
             crossing: LineCrossing event to process
         """
-        try:
-            if crossing.direction == CrossingDirection.ENTRY:
-                self.count_inside += 1
-                self.total_entered += 1
-                event_type = "entry"
-                
-            elif crossing.direction == CrossingDirection.EXIT:
-                self.count_inside = max(0, self.count_inside - 1)  # Prevent negative counts
-                self.total_exited += 1
-                event_type = "exit"
+        if crossing.direction == CrossingDirection.ENTRY:
+            self.count_inside += 1
+            self.total_entered += 1
+            event_type = "entry"
             
-            else:
-                return
-            
-            # Log to database
-            self.db_manager.log_event(
-                event_type=event_type,
-                person_id=crossing.object_id,
-                count_inside=self.count_inside,
-                total_entered=self.total_entered,
-                total_exited=self.total_exited
-            )
-            
-            # Log to application logger
-            log_detection_event(
-                self.logger, 
-                event_type, 
-                crossing.object_id, 
-                self.count_inside
-            )
-            
-            # Add to recent crossings history
-            self.recent_crossings.append(crossing)
-            if len(self.recent_crossings) > self.max_history:
-                self.recent_crossings = self.recent_crossings[-self.max_history//2:]
+        elif crossing.direction == CrossingDirection.EXIT:
+            self.count_inside = max(0, self.count_inside - 1)  # Prevent negative counts
+            self.total_exited += 1
+            event_type = "exit"
         
-        except Exception as e:
-            self.logger.error(f"Error processing crossing event: {e}")
+        else:
+            return
+        
+        # Queue for the database and the detection log (both handled by _event_writer)
+        self._pending_events.append({
+            'timestamp': crossing.timestamp,
+            'event_type': event_type,
+            'person_id': crossing.object_id,
+            'count_inside': self.count_inside,
+            'total_entered': self.total_entered,
+            'total_exited': self.total_exited
+        })
+        
+        # Add to recent crossings history
+        self.recent_crossings.append(crossing)
+    
+    def _event_writer(self):
+        """Write queued crossing event batches to the database and the detection log."""
+        while True:
+            batch = self._event_q.get()
+            try:
+                self.db_manager.log_events(batch)
+                if self.logger.isEnabledFor(logging.INFO):
+                    for event in batch:
+                        log_detection_event(self.logger, event['event_type'],
+                                            event['person_id'], event['count_inside'])
+            except Exception as e:
+                self.logger.error(f"Error writing crossing events: {e}")
+            finally:
+                self._event_q.task_done()
+    
+    def flush(self):
+        """Block until every crossing event detected so far is in the database."""
+        if self._pending_events:
+            self._event_q.put(self._pending_events)
+            self._pending_events = []
+        self._event_q.join()
     
     def get_counts(self) -> Dict[str, int]:
         """
@@ -345,14 +561,16 @@ class PeopleCounter:
             Success status
         """
         try:
+            # Earlier crossings must reach the database before the reset event
+            self.flush()
+            
             # Reset internal counters
             self.count_inside = 0
             self.total_entered = 0
             self.total_exited = 0
             
             # Clear tracking state
-            self.object_positions.clear()
-            self.crossed_objects.clear()
+            self._clear_tracking()
             self.recent_crossings.clear()
             
             # Log reset event to database
@@ -380,10 +598,11 @@ class PeopleCounter:
         """
         self.config.update_counting_line(start_percent, end_percent)
         self.counting_line = self.config.COUNTING_LINE
+        self._entry_sign = -1 if self.config.ENTRY_DIRECTION == "right_to_left" else 1
+        self._line_cache_key = None
         
         # Clear tracking state since line position changed
-        self.object_positions.clear()
-        self.crossed_objects.clear()
+        self._clear_tracking()
         
         self.logger.info(f"Updated counting line: {start_percent} to {end_percent}")
     
@@ -397,7 +616,8 @@ class PeopleCounter:
         Returns:
             List of recent LineCrossing events
         """
-        return self.recent_crossings[-limit:] if self.recent_crossings else []
+        recent = self.recent_crossings
+        return list(islice(recent, max(0, len(recent) - limit), None))
     
     def get_statistics(self) -> Dict[str, any]:
         """
@@ -409,8 +629,8 @@ class PeopleCounter:
         return {
             'counts': self.get_counts(),
             'recent_crossings': len(self.recent_crossings),
-            'tracked_objects': len(self.object_positions),
-            'crossed_objects': len(self.crossed_objects),
+            'tracked_objects': len(self._row_of),
+            'crossed_objects': int(np.count_nonzero(self._has_crossed[list(self._row_of.values())])),
             'counting_line': self.counting_line
         }
 
@@ -3,16 +3,29 @@ Web dashboard for the Smart Crowd Monitoring System.
 Provides live monitoring and historical data visualization using Flask.
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
+from flask.json.provider import DefaultJSONProvider
 import json
+import hashlib
+import queue
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable
 import threading
 import time
 import logging
 from pathlib import Path
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
 from utils.config import get_config
 from utils.logger import default_logger
 from src.database import get_database_manager
@@ -21,11 +34,50 @@ from src.reports import create_report_generator
 from src.alerts import create_alert_manager
 
 
+# Weekday names indexed by date.weekday(), for the weekly stats without strftime
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# The pages ship as plain HTML files (no Jinja variables) and are served as-is
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+# Chart.js is loaded from the CDN unless a copy has been downloaded to src/static
+CHART_JS_FILE = 'chart-4.4.1.umd.js'
+CHART_JS_CDN = b'https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.js'
+
+# Suffixes flask-compress adds to the ETag of a compressed response
+_COMPRESSED_ETAG_SUFFIXES = (':gzip', ':br', ':deflate')
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with orjson.
+    
+    Types orjson does not handle natively (dates, Decimal, UUID, ...) fall back
+    to Flask's default conversion, so responses look the same as with json.
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 class DashboardServer:
     """
     Flask-based web dashboard for the people counter system.
     """
     
+    # Stats responses for today (or a week containing it) are rebuilt after this many seconds;
+    # past days no longer change and stay cached until evicted
+    STATS_TTL = 30
+    STATS_CACHE_SIZE = 128
+    
     def __init__(self, host: str = None, port: int = None, logger: logging.Logger = None):
         """
         Initialize dashboard server.
@@ -45,6 +97,7 @@ class DashboardServer:
         
         # Initialize components
         self.db_manager = get_database_manager()
+        self.db_manager.warm()
         self.admin_controller = create_admin_controller()
         self.report_generator = create_report_generator()
         self.alert_manager = create_alert_manager()
@@ -52,6 +105,22 @@ class DashboardServer:
         # Create Flask app
         self.app = Flask(__name__)
         self.app.secret_key = 'crowd_monitor_secret_key_2024'  # Change in production
+        if orjson is not None:
+            self.app.json = OrjsonJSONProvider(self.app)
+        # Polled every few seconds by the browser: no indentation, no key sorting
+        self.app.json.compact = True
+        self.app.json.sort_keys = False
+        
+        # Compress JSON and pages; the event stream and report files are left alone
+        if Compress is not None:
+            self.app.config.update(
+                COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'text/javascript',
+                                    'application/javascript'],
+                COMPRESS_ALGORITHM=['br', 'gzip'],
+                COMPRESS_LEVEL=6,
+                COMPRESS_MIN_SIZE=500
+            )
+            Compress(self.app)
         
         # Live data cache
         self.live_data_cache = {
@@ -60,26 +129,52 @@ class DashboardServer:
             'last_update': datetime.now()
         }
         
+        # Serialized stats responses: {key: (monotonic expiry, JSON body)}
+        self._stats_cache = {}
+        self._stats_lock = threading.Lock()
+        
+        # Page bodies and their ETags, read once: {filename: (bytes, etag)}
+        self._pages = {}
+        
         # Background thread for data updates
         self.update_thread = None
         self.running = False
         
+        # Live update streams: one queue per connected browser, fed only when data changes
+        self._subscribers = set()
+        self._subscribers_lock = threading.Lock()
+        self._last_pushed = None
+        
         # Register routes
         self._register_routes()
     
     def _register_routes(self):
         """Register all Flask routes."""
         
+        # Data sources of the polled endpoints, bound once instead of looked up per request
+        get_system_status = self.admin_controller.get_system_status
+        get_current_count = self.db_manager.get_current_count
+        get_active_alerts = self.alert_manager.get_active_alerts
+        get_alert_statistics = self.alert_manager.get_alert_statistics
+        etag_for = self._etag
+        
+        @self.app.after_request
+        def cache_static(response):
+            """Static assets carry their version in the file name and never change."""
+            if response.status_code == 200 and request.path.startswith(self.app.static_url_path + '/'):
+                response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+            return response
+        
         @self.app.route('/')
         def index():
             """Main dashboard page."""
-            return render_template('dashboard.html')
+            return self._static_page('dashboard.html')
         
         @self.app.route('/api/status')
         def api_status():
             """Get current system status."""
             try:
-                status = self.admin_controller.get_system_status()
+                status = get_system_status()
                 return jsonify({
                     'success': True,
                     'data': status
@@ -94,12 +189,21 @@ class DashboardServer:
         def api_counts():
             """Get current people counts."""
             try:
-                counts = self.db_manager.get_current_count()
-                return jsonify({
+                counts = get_current_count()
+                
+                # Unchanged counts: let the browser keep its copy
+                etag = etag_for((counts.get('count_inside'), counts.get('total_entered'),
+                                   counts.get('total_exited')))
+                if self._client_has(etag):
+                    return self._not_modified(etag)
+                
+                response = jsonify({
                     'success': True,
                     'data': counts,
                     'timestamp': datetime.now().isoformat()
                 })
+                response.set_etag(etag)
+                return response
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -112,20 +216,28 @@ class DashboardServer:
             try:
                 target_date = request.args.get('date')
                 if target_date:
-                    target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+                    target_date = date.fromisoformat(target_date)
                 else:
                     target_date = date.today()
                 
-                stats = self.db_manager.get_daily_stats(target_date)
-                hourly_data = self.db_manager.get_hourly_distribution(target_date)
-                
-                return jsonify({
-                    'success': True,
-                    'data': {
-                        'daily_stats': stats,
-                        'hourly_breakdown': hourly_data
+                def build():
+                    stats = self.db_manager.get_daily_stats(target_date)
+                    
+                    # Dense 24-slot array, ready to be plotted as-is
+                    hourly_entries = [0] * 24
+                    for hour in self.db_manager.get_hourly_distribution(target_date):
+                        hourly_entries[hour['hour']] = hour.get('entries') or 0
+                    
+                    return {
+                        'success': True,
+                        'data': {
+                            'daily_stats': stats,
+                            'hourly_entries': hourly_entries
+                        }
                     }
-                })
+                
+                return self._cached_json(('daily', target_date.isoformat()),
+                                         target_date < date.today(), build)
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -138,25 +250,29 @@ class DashboardServer:
             try:
                 start_date = request.args.get('start_date')
                 if start_date:
-                    start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+                    start_date = date.fromisoformat(start_date)
                 else:
                     # Default to current week
                     today = date.today()
                     start_date = today - timedelta(days=today.weekday())
                 
-                # Get daily data for the week
-                weekly_data = []
-                for i in range(7):
-                    current_date = start_date + timedelta(days=i)
-                    daily_stats = self.db_manager.get_daily_stats(current_date)
-                    daily_stats['date'] = current_date.isoformat()
-                    daily_stats['day_name'] = current_date.strftime('%A')
-                    weekly_data.append(daily_stats)
+                def build():
+                    # Get daily data for the week in one query
+                    stats_by_day = self.db_manager.get_daily_stats_range(start_date, start_date + timedelta(days=6))
+                    weekly_data = []
+                    for i in range(7):
+                        current_date = start_date + timedelta(days=i)
+                        daily_stats = stats_by_day.get(current_date) or {}
+                        daily_stats['date'] = current_date.isoformat()
+                        daily_stats['day_name'] = DAY_NAMES[current_date.weekday()]
+                        weekly_data.append(daily_stats)
+                    return {
+                        'success': True,
+                        'data': weekly_data
+                    }
                 
-                return jsonify({
-                    'success': True,
-                    'data': weekly_data
-                })
+                return self._cached_json(('weekly', start_date.isoformat()),
+                                         start_date + timedelta(days=6) < date.today(), build)
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -167,26 +283,23 @@ class DashboardServer:
         def api_alerts():
             """Get active alerts."""
             try:
-                active_alerts = self.alert_manager.get_active_alerts()
-                alert_stats = self.alert_manager.get_alert_statistics()
+                active_alerts = get_active_alerts()
+                alert_stats = get_alert_statistics()
+                alerts_data = [alert.as_dict() for alert in active_alerts]
                 
-                alerts_data = []
-                for alert in active_alerts:
-                    alerts_data.append({
-                        'type': alert.alert_type.value,
-                        'message': alert.message,
-                        'timestamp': alert.timestamp.isoformat(),
-                        'current_count': alert.current_count,
-                        'threshold': alert.threshold
-                    })
+                etag = etag_for(([(a['type'], a['timestamp']) for a in alerts_data], alert_stats))
+                if self._client_has(etag):
+                    return self._not_modified(etag)
                 
-                return jsonify({
+                response = jsonify({
                     'success': True,
                     'data': {
                         'active_alerts': alerts_data,
                         'statistics': alert_stats
                     }
                 })
+                response.set_etag(etag)
+                return response
             except Exception as e:
                 return jsonify({
                     'success': False,
@@ -202,10 +315,11 @@ class DashboardServer:
                 admin_user = data.get('admin_user', 'web_admin')
                 
                 result = self.admin_controller.reset_all_counts(reason, admin_user)
+                self._clear_stats_cache()
                 
                 return jsonify({
                     'success': result['success'],
-                    'data': result
+                    'data': result.as_dict()
                 })
             except Exception as e:
                 return jsonify({
@@ -231,7 +345,7 @@ class DashboardServer:
                 
                 return jsonify({
                     'success': result['success'],
-                    'data': result
+                    'data': result.as_dict()
                 })
             except Exception as e:
                 return jsonify({
@@ -256,7 +370,7 @@ class DashboardServer:
                 
                 return jsonify({
                     'success': result['success'],
-                    'data': result
+                    'data': result.as_dict()
                 })
             except Exception as e:
                 return jsonify({
@@ -276,7 +390,7 @@ class DashboardServer:
                 
                 # Parse target date
                 if target_date_str:
-                    target_date = datetime.strptime(target_date_str, '%Y-%m-%d').date()
+                    target_date = date.fromisoformat(target_date_str)
                 else:
                     target_date = date.today()
                 
@@ -320,431 +434,156 @@ class DashboardServer:
                 if not filename:
                     return jsonify({'error': 'No file specified'}), 400
                 
-                file_path = self.config.REPORTS_DIR / filename
+                # Reports sit directly in REPORTS_DIR; anything resolving elsewhere is refused
+                reports_dir = self.config.REPORTS_DIR.resolve()
+                file_path = (reports_dir / filename).resolve()
+                if file_path.parent != reports_dir:
+                    return jsonify({'error': 'Invalid file name'}), 403
                 
-                if not file_path.exists():
+                # Generated reports never change: let browsers cache them and use Range/304
+                try:
+                    return send_file(file_path, as_attachment=True, conditional=True,
+                                     etag=True, max_age=86400)
+                except (FileNotFoundError, IsADirectoryError):
                     return jsonify({'error': 'File not found'}), 404
                 
-                return send_file(file_path, as_attachment=True)
-                
             except Exception as e:
                 return jsonify({'error': str(e)}), 500
         
+        @self.app.route('/api/stream')
+        def api_stream():
+            """Server-Sent Events stream of counts and active alerts, sent when they change."""
+            subscriber = queue.SimpleQueue()
+            with self._subscribers_lock:
+                self._subscribers.add(subscriber)
+                if self._last_pushed is not None:
+                    subscriber.put(self._last_pushed)
+            
+            def event_stream():
+                try:
+                    # Each open stream holds a server thread; release it when the server stops
+                    while self.running:
+                        try:
+                            payload = subscriber.get(timeout=15)
+                        except queue.Empty:
+                            yield ": keep-alive\n\n"  # Comment line; detects closed connections
+                            continue
+                        if payload is None:  # Woken by stop_server()
+                            break
+                        yield f"data: {payload}\n\n"
+                finally:
+                    with self._subscribers_lock:
+                        self._subscribers.discard(subscriber)
+            
+            return Response(event_stream(), mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache'})
+        
         @self.app.route('/admin')
         def admin_page():
             """Admin control page."""
-            return render_template('admin.html')
+            return self._static_page('admin.html')
         
         @self.app.route('/reports')
         def reports_page():
             """Reports page."""
-            return render_template('reports.html')
+            return self._static_page('reports.html')
     
-    def create_templates(self):
-        """Create basic HTML templates if they don't exist."""
-        templates_dir = Path(__file__).parent / 'templates'
-        templates_dir.mkdir(exist_ok=True)
-        
-        # Main dashboard template
-        dashboard_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Crowd Monitoring Dashboard</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; }
-        .header { background: #2c3e50; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .stats-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin-bottom: 20px; }
-        .stat-card { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
-        .stat-number { font-size: 2em; font-weight: bold; color: #3498db; }
-        .stat-label { color: #666; margin-top: 5px; }
-        .chart-container { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .alert { padding: 15px; margin: 10px 0; border-radius: 4px; }
-        .alert-warning { background-color: #fff3cd; border: 1px solid #ffeaa7; color: #856404; }
-        .alert-danger { background-color: #f8d7da; border: 1px solid #f5c6cb; color: #721c24; }
-        .btn { padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; }
-        .btn-primary { background-color: #3498db; color: white; }
-        .btn-danger { background-color: #e74c3c; color: white; }
-        #updateTime { color: #666; font-size: 0.9em; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Crowd Monitoring Dashboard</h1>
-            <p>Real-time monitoring and analytics</p>
-            <div id="updateTime">Last updated: Loading...</div>
-        </div>
-        
-        <div id="alerts-container"></div>
-        
-        <div class="stats-grid">
-            <div class="stat-card">
-                <div class="stat-number" id="count-inside">-</div>
-                <div class="stat-label">People Inside</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" id="total-entered">-</div>
-                <div class="stat-label">Total Entered Today</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" id="total-exited">-</div>
-                <div class="stat-label">Total Exited Today</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number" id="peak-count">-</div>
-                <div class="stat-label">Today's Peak Count</div>
-            </div>
-        </div>
-        
-        <div class="chart-container">
-            <h3>Hourly Distribution Today</h3>
-            <canvas id="hourly-chart" width="800" height="400"></canvas>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px;">
-            <a href="/admin" class="btn btn-primary">Admin Controls</a>
-            <a href="/reports" class="btn btn-primary">View Reports</a>
-        </div>
-    </div>
-    
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script>
-        // Initialize chart
-        const ctx = document.getElementById('hourly-chart').getContext('2d');
-        const hourlyChart = new Chart(ctx, {
-            type: 'bar',
-            data: {
-                labels: Array.from({length: 24}, (_, i) => i + ':00'),
-                datasets: [{
-                    label: 'Entries',
-                    data: new Array(24).fill(0),
-                    backgroundColor: 'rgba(52, 152, 219, 0.6)'
-                }]
-            },
-            options: {
-                responsive: true,
-                scales: {
-                    y: { beginAtZero: true }
-                }
-            }
-        });
-        
-        function updateDashboard() {
-            // Update counts
-            fetch('/api/counts')
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        document.getElementById('count-inside').textContent = data.data.count_inside;
-                        document.getElementById('total-entered').textContent = data.data.total_entered;
-                        document.getElementById('total-exited').textContent = data.data.total_exited;
-                    }
-                })
-                .catch(error => console.error('Error fetching counts:', error));
-            
-            // Update daily stats
-            fetch('/api/daily-stats')
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        const dailyStats = data.data.daily_stats;
-                        const hourlyData = data.data.hourly_breakdown;
-                        
-                        document.getElementById('peak-count').textContent = dailyStats.peak_count || 0;
-                        
-                        // Update hourly chart
-                        const entries = new Array(24).fill(0);
-                        hourlyData.forEach(hour => {
-                            entries[hour.hour] = hour.entries || 0;
-                        });
-                        hourlyChart.data.datasets[0].data = entries;
-                        hourlyChart.update();
-                    }
-                })
-                .catch(error => console.error('Error fetching daily stats:', error));
-            
-            // Update alerts
-            fetch('/api/alerts')
-                .then(response => response.json())
-                .then(data => {
-                    if (data.success) {
-                        const alertsContainer = document.getElementById('alerts-container');
-                        alertsContainer.innerHTML = '';
-                        
-                        data.data.active_alerts.forEach(alert => {
-                            const alertDiv = document.createElement('div');
-                            alertDiv.className = alert.type === 'crowd_limit' ? 'alert alert-danger' : 'alert alert-warning';
-                            alertDiv.innerHTML = `<strong>${alert.type.toUpperCase()}:</strong> ${alert.message}`;
-                            alertsContainer.appendChild(alertDiv);
-                        });
-                    }
-                })
-                .catch(error => console.error('Error fetching alerts:', error));
-            
-            // Update timestamp
-            document.getElementById('updateTime').textContent = 'Last updated: ' + new Date().toLocaleTimeString();
-        }
+    @staticmethod
+    def _etag(state: Any) -> str:
+        """
+        ETag for a response built from plain data; the same in every worker process.
         
-        // Initial load and set interval
-        updateDashboard();
-        setInterval(updateDashboard, 5000); // Update every 5 seconds
-    </script>
-</body>
-</html>
-        '''
-        
-        # Save dashboard template
-        with open(templates_dir / 'dashboard.html', 'w') as f:
-            f.write(dashboard_html)
-        
-        # Create basic admin template
-        admin_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Crowd Monitor - Admin Panel</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
-        .container { max-width: 800px; margin: 0 auto; }
-        .header { background: #e74c3c; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .control-panel { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .btn { padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; margin: 5px; }
-        .btn-danger { background-color: #e74c3c; color: white; }
-        .btn-primary { background-color: #3498db; color: white; }
-        .btn-success { background-color: #27ae60; color: white; }
-        input[type="number"], input[type="text"] { padding: 8px; border: 1px solid #ddd; border-radius: 4px; width: 100px; }
-        .result { margin: 10px 0; padding: 10px; border-radius: 4px; }
-        .success { background-color: #d4edda; color: #155724; }
-        .error { background-color: #f8d7da; color: #721c24; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Admin Control Panel</h1>
-            <p>Administrative functions for the Crowd Monitoring System</p>
-        </div>
-        
-        <div class="control-panel">
-            <h3>Count Management</h3>
-            <button class="btn btn-danger" onclick="resetCounts()">Reset All Counts</button>
-            <div id="reset-result"></div>
-        </div>
-        
-        <div class="control-panel">
-            <h3>Crowd Limit Settings</h3>
-            <input type="number" id="new-crowd-limit" placeholder="New limit" min="1">
-            <button class="btn btn-primary" onclick="updateCrowdLimit()">Update Crowd Limit</button>
-            <div id="limit-result"></div>
-        </div>
-        
-        <div class="control-panel">
-            <h3>Alert Settings</h3>
-            <label><input type="checkbox" id="alerts-enabled"> Enable Alerts</label><br>
-            <label><input type="checkbox" id="sound-alerts"> Sound Alerts</label><br>
-            <label><input type="checkbox" id="popup-alerts"> Popup Alerts</label><br>
-            <input type="number" id="alert-cooldown" placeholder="Cooldown (sec)" min="5">
-            <button class="btn btn-primary" onclick="updateAlertSettings()">Update Alert Settings</button>
-            <div id="alerts-result"></div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px;">
-            <a href="/" class="btn btn-success">Back to Dashboard</a>
-        </div>
-    </div>
-    
-    <script>
-        function resetCounts() {
-            const reason = prompt('Enter reason for reset:') || 'Admin panel reset';
+        Args:
+            state: Values that fully determine the response body
             
-            fetch('/api/admin/reset-counts', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ reason: reason, admin_user: 'web_admin' })
-            })
-            .then(response => response.json())
-            .then(data => {
-                const result = document.getElementById('reset-result');
-                result.className = 'result ' + (data.success ? 'success' : 'error');
-                result.textContent = data.data ? data.data.message : data.error;
-            })
-            .catch(error => {
-                const result = document.getElementById('reset-result');
-                result.className = 'result error';
-                result.textContent = 'Error: ' + error.message;
-            });
-        }
+        Returns:
+            Hex digest of the state's repr
+        """
+        return hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()
+    
+    @staticmethod
+    def _client_has(etag: str) -> bool:
+        """
+        Whether the request's If-None-Match names this ETag.
         
-        function updateCrowdLimit() {
-            const newLimit = parseInt(document.getElementById('new-crowd-limit').value);
-            
-            if (!newLimit || newLimit <= 0) {
-                alert('Please enter a valid crowd limit');
-                return;
-            }
-            
-            fetch('/api/admin/update-crowd-limit', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ new_limit: newLimit, admin_user: 'web_admin' })
-            })
-            .then(response => response.json())
-            .then(data => {
-                const result = document.getElementById('limit-result');
-                result.className = 'result ' + (data.success ? 'success' : 'error');
-                result.textContent = data.data ? data.data.message : data.error;
-            })
-            .catch(error => {
-                const result = document.getElementById('limit-result');
-                result.className = 'result error';
-                result.textContent = 'Error: ' + error.message;
-            });
-        }
+        flask-compress appends ":gzip"/":br"/":deflate" to the ETag of every
+        response it compresses, so that suffix is dropped before comparing.
         
-        function updateAlertSettings() {
-            const settings = {
-                alerts_enabled: document.getElementById('alerts-enabled').checked,
-                sound_alerts: document.getElementById('sound-alerts').checked,
-                popup_alerts: document.getElementById('popup-alerts').checked,
-                alert_cooldown: parseInt(document.getElementById('alert-cooldown').value) || null,
-                admin_user: 'web_admin'
-            };
+        Args:
+            etag (str): ETag of the current data
             
-            fetch('/api/admin/update-alert-settings', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(settings)
-            })
-            .then(response => response.json())
-            .then(data => {
-                const result = document.getElementById('alerts-result');
-                result.className = 'result ' + (data.success ? 'success' : 'error');
-                result.textContent = data.data ? data.data.message : data.error;
-            })
-            .catch(error => {
-                const result = document.getElementById('alerts-result');
-                result.className = 'result error';
-                result.textContent = 'Error: ' + error.message;
-            });
-        }
-    </script>
-</body>
-</html>
-        '''
-        
-        # Save admin template
-        with open(templates_dir / 'admin.html', 'w') as f:
-            f.write(admin_html)
-        
-        # Create reports template
-        reports_html = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Crowd Monitor - Reports</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background-color: #f5f5f5; }
-        .container { max-width: 800px; margin: 0 auto; }
-        .header { background: #27ae60; color: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .report-panel { background: white; padding: 20px; border-radius: 8px; margin-bottom: 20px; }
-        .btn { padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; margin: 5px; }
-        .btn-success { background-color: #27ae60; color: white; }
-        .btn-primary { background-color: #3498db; color: white; }
-        select, input[type="date"] { padding: 8px; border: 1px solid #ddd; border-radius: 4px; margin: 5px; }
-        .result { margin: 10px 0; padding: 10px; border-radius: 4px; }
-        .success { background-color: #d4edda; color: #155724; }
-        .error { background-color: #f8d7da; color: #721c24; }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Reports & Analytics</h1>
-            <p>Generate and download crowd reports</p>
-        </div>
-        
-        <div class="report-panel">
-            <h3>Generate Report</h3>
-            <select id="report-type">
-                <option value="daily">Daily Report</option>
-                <option value="weekly">Weekly Report</option>
-                <option value="monthly">Monthly Report</option>
-            </select>
-            <input type="date" id="report-date" value="">
-            <select id="report-format">
-                <option value="csv">CSV Format</option>
-                <option value="excel">Excel Format</option>
-            </select>
-            <button class="btn btn-success" onclick="generateReport()">Generate Report</button>
-            <div id="report-result"></div>
-        </div>
-        
-        <div style="text-align: center; margin-top: 20px;">
-            <a href="/" class="btn btn-primary">Back to Dashboard</a>
-        </div>
-    </div>
+        Returns:
+            True if the browser already has the current data
+        """
+        if_none_match = request.if_none_match
+        if if_none_match.star_tag:
+            return True
+        for tag in if_none_match:
+            if tag.endswith(_COMPRESSED_ETAG_SUFFIXES):
+                tag = tag.rsplit(':', 1)[0]
+            if tag == etag:
+                return True
+        return False
     
-    <script>
-        // Set default date to today
-        document.getElementById('report-date').value = new Date().toISOString().split('T')[0];
-        
-        function generateReport() {
-            const reportType = document.getElementById('report-type').value;
-            const reportDate = document.getElementById('report-date').value;
-            const reportFormat = document.getElementById('report-format').value;
-            
-            const resultDiv = document.getElementById('report-result');
-            resultDiv.innerHTML = 'Generating report...';
-            resultDiv.className = 'result';
-            
-            fetch('/api/reports/generate', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    report_type: reportType,
-                    target_date: reportDate,
-                    format: reportFormat,
-                    admin_user: 'web_admin'
-                })
-            })
-            .then(response => response.json())
-            .then(data => {
-                if (data.success) {
-                    resultDiv.className = 'result success';
-                    resultDiv.innerHTML = `
-                        Report generated successfully!<br>
-                        <a href="${data.data.download_url}" class="btn btn-primary" download>
-                            Download ${data.data.filename}
-                        </a>
-                    `;
-                } else {
-                    resultDiv.className = 'result error';
-                    resultDiv.textContent = data.error;
-                }
-            })
-            .catch(error => {
-                resultDiv.className = 'result error';
-                resultDiv.textContent = 'Error: ' + error.message;
-            });
-        }
-    </script>
-</body>
-</html>
-        '''
+    @staticmethod
+    def _not_modified(etag: str) -> Response:
+        """Empty 304 response for a client that already has the current data."""
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    
+    def _static_page(self, filename: str) -> Response:
+        """
+        Serve an HTML page from memory, answering 304 when the browser's copy is current.
         
-        # Save reports template
-        with open(templates_dir / 'reports.html', 'w') as f:
-            f.write(reports_html)
+        Args:
+            filename (str): Page file in the templates directory
+            
+        Returns:
+            Flask response with the page or a 304
+        """
+        page = self._pages.get(filename)
+        if page is None:
+            body = (TEMPLATES_DIR / filename).read_bytes()
+            if (Path(self.app.static_folder) / CHART_JS_FILE).is_file():
+                body = body.replace(CHART_JS_CDN, f"{self.app.static_url_path}/{CHART_JS_FILE}".encode())
+            page = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+            self._pages[filename] = page
+        
+        body, etag = page
+        response = Response(body, mimetype='text/html')
+        response.set_etag(etag)
+        return response.make_conditional(request)
+    
+    def _cached_json(self, key: tuple, final: bool, build: Callable[[], Dict]):
+        """
+        Serve a JSON response from the stats cache, building it on a miss.
         
-        self.logger.info("Dashboard templates created")
+        Args:
+            key (tuple): Cache key
+            final (bool): Whether the data can no longer change (cached without expiry)
+            build (Callable): Produces the response payload
+            
+        Returns:
+            Flask JSON response
+        """
+        now = time.monotonic()
+        entry = self._stats_cache.get(key)
+        if entry is None or entry[0] <= now:
+            body = self.app.json.dumps(build())
+            entry = (float('inf') if final else now + self.STATS_TTL, body)
+            with self._stats_lock:
+                self._stats_cache.pop(key, None)
+                self._stats_cache[key] = entry
+                if len(self._stats_cache) > self.STATS_CACHE_SIZE:
+                    del self._stats_cache[next(iter(self._stats_cache))]
+        
+        return self.app.response_class(entry[1], mimetype='application/json')
+    
+    def _clear_stats_cache(self):
+        """Drop all cached stats responses (after counts change outside normal counting)."""
+        with self._stats_lock:
+            self._stats_cache.clear()
     
     def start_server(self, threaded: bool = True):
         """
@@ -754,14 +593,7 @@ class DashboardServer:
             threaded (bool): Run server in a separate thread
         """
         try:
-            # Create templates
-            self.create_templates()
-            
-            # Start data update thread
-            self.running = True
-            self.update_thread = threading.Thread(target=self._update_live_data)
-            self.update_thread.daemon = True
-            self.update_thread.start()
+            self.start_live_updates()
             
             if threaded:
                 # Run in separate thread
@@ -787,11 +619,25 @@ class DashboardServer:
             self.logger.error(f"Failed to start dashboard server: {e}")
             raise
     
+    def start_live_updates(self):
+        """Start the background thread that refreshes live data and feeds /api/stream."""
+        if self.update_thread and self.update_thread.is_alive():
+            return
+        
+        self.running = True
+        self.update_thread = threading.Thread(target=self._update_live_data)
+        self.update_thread.daemon = True
+        self.update_thread.start()
+    
     def stop_server(self):
         """Stop the dashboard server."""
         self.running = False
+        with self._subscribers_lock:
+            for subscriber in self._subscribers:
+                subscriber.put(None)  # End open /api/stream responses
         if self.update_thread and self.update_thread.is_alive():
             self.update_thread.join(timeout=5)
+        self.alert_manager.shutdown()
     
     def _update_live_data(self):
         """Background thread to update live data cache."""
@@ -802,13 +648,7 @@ class DashboardServer:
                 
                 # Update alerts
                 active_alerts = self.alert_manager.get_active_alerts()
-                alerts_data = [
-                    {
-                        'type': alert.alert_type.value,
-                        'message': alert.message,
-                        'timestamp': alert.timestamp.isoformat()
-                    } for alert in active_alerts
-                ]
+                alerts_data = [alert.as_dict() for alert in active_alerts]
                 
                 # Update cache
                 self.live_data_cache = {
@@ -817,6 +657,14 @@ class DashboardServer:
                     'last_update': datetime.now()
                 }
                 
+                # Push to connected browsers only when something changed
+                payload = self.app.json.dumps({'counts': counts, 'alerts': alerts_data})
+                if payload != self._last_pushed:
+                    with self._subscribers_lock:
+                        self._last_pushed = payload
+                        for subscriber in self._subscribers:
+                            subscriber.put(payload)
+                
             except Exception as e:
                 self.logger.error(f"Error updating live data: {e}")
             
@@ -837,6 +685,26 @@ def create_dashboard_server(host: str = None, port: int = None) -> DashboardServ
     return DashboardServer(host=host, port=port)
 
 
+def create_app() -> Flask:
+    """
+    Application factory for serving the dashboard with a production server,
+    whose worker pool handles many polling browser tabs concurrently, e.g.:
+    
+        hypercorn 'src.dashboard:create_app()' --workers 2
+    
+    Hypercorn runs this WSGI app in a thread pool, and every open dashboard
+    tab keeps one of those threads busy with its /api/stream response. Size
+    the pool for the expected number of tabs (workers x threads per worker),
+    or tabs beyond that limit will queue until a stream closes.
+    
+    Returns:
+        Flask application
+    """
+    dashboard = create_dashboard_server()
+    dashboard.start_live_updates()
+    return dashboard.app
+
+
 def main():
     """Run dashboard server as standalone application."""
     import argparse
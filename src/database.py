@@ -5,6 +5,7 @@ Handles SQLite database setup, table creation, and CRUD operations for logging e
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Tuple, Any
 from pathlib import Path
@@ -34,13 +35,43 @@ class DatabaseManager:
         # Ensure database directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
+        # One connection per thread, reused across calls (see _connect)
+        self._local = threading.local()
+        
         # Initialize database
         self.init_database()
     
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's connection, opening it on first use.
+        
+        Reusing the connection keeps its schema and prepared statements cached;
+        `with conn:` still commits or rolls back each operation.
+        
+        Returns:
+            sqlite3.Connection owned by the current thread
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256)
+            conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL; no fsync per commit
+            conn.execute("PRAGMA mmap_size=268435456")
+            self._local.conn = conn
+        return conn
+    
+    def warm(self):
+        """Open this thread's connection and read the schema before the first real query."""
+        try:
+            self._connect().execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+        except Exception as e:
+            self.logger.error(f"Error warming database connection: {e}")
+    
     def init_database(self):
         """Create database tables if they don't exist."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
+                # Readers (dashboard) and the writer (counter) no longer block each other
+                conn.execute("PRAGMA journal_mode=WAL")
                 cursor = conn.cursor()
                 
                 # Create events table
@@ -134,7 +165,7 @@ class DatabaseManager:
             int: ID of the inserted event record
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -165,6 +196,55 @@ class DatabaseManager:
             log_database_operation(self.logger, f"Log event: {event_type}", False, str(e))
             raise
     
+    def log_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Log several people counting events and their statistics in one transaction.
+        
+        Args:
+            events: Dicts with the log_event arguments (event_type, person_id,
+                    count_inside, total_entered, total_exited, optional confidence
+                    and notes) plus an optional 'timestamp' (default: now)
+        
+        Returns:
+            int: Number of event records inserted
+        """
+        if not events:
+            return 0
+        
+        rows = [(
+            event.get('timestamp') or datetime.now(),
+            event['event_type'],
+            event['person_id'],
+            event['count_inside'],
+            event['total_entered'],
+            event['total_exited'],
+            event.get('confidence'),
+            event.get('notes')
+        ) for event in events]
+        
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany("""
+                    INSERT INTO events (timestamp, event_type, person_id, count_inside, 
+                                      total_entered, total_exited, confidence, notes)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """, rows)
+                
+                # Update daily and hourly statistics in the same transaction
+                for row in rows:
+                    self._apply_statistics(cursor, row[1], row[3], row[0])
+                
+                conn.commit()
+                
+                log_database_operation(self.logger, f"Events logged: {len(rows)}", True)
+                return len(rows)
+                
+        except Exception as e:
+            log_database_operation(self.logger, f"Log events: {len(rows)}", False, str(e))
+            raise
+    
     def log_alert(self, alert_type: str, current_count: int, threshold: int, 
                   notes: str = None) -> int:
         """
@@ -180,7 +260,7 @@ class DatabaseManager:
             int: ID of the inserted alert record
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -198,6 +278,34 @@ class DatabaseManager:
             log_database_operation(self.logger, f"Log alert: {alert_type}", False, str(e))
             raise
     
+    def log_alerts_bulk(self, rows: List[Tuple[datetime, str, int, int, Optional[str]]]) -> int:
+        """
+        Log several alerts to the database in one transaction.
+        
+        Args:
+            rows: (timestamp, alert_type, current_count, threshold, notes) tuples
+        
+        Returns:
+            int: Number of alert records inserted
+        """
+        if not rows:
+            return 0
+        
+        try:
+            with self._connect() as conn:
+                conn.executemany("""
+                    INSERT INTO alerts (timestamp, alert_type, current_count, threshold, notes)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+                conn.commit()
+                
+                log_database_operation(self.logger, f"Alerts logged: {len(rows)}", True)
+                return len(rows)
+                
+        except Exception as e:
+            log_database_operation(self.logger, f"Log alerts: {len(rows)}", False, str(e))
+            raise
+    
     def get_current_count(self) -> Dict[str, int]:
         """
         Get the current people count from the last recorded event.
@@ -206,7 +314,7 @@ class DatabaseManager:
             Dict with current statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -245,7 +353,7 @@ class DatabaseManager:
             target_date = date.today()
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Get from daily_summary table first
@@ -277,6 +385,82 @@ class DatabaseManager:
             log_database_operation(self.logger, f"Get daily stats for {target_date}", False, str(e))
             return {}
     
+    def get_daily_stats_range(self, start_date: date, end_date: date) -> Dict[date, Dict[str, Any]]:
+        """
+        Get statistics for every date in a range with one summary query.
+        
+        Days without a daily_summary row are calculated from the events table,
+        all in a single grouped query.
+        
+        Args:
+            start_date (date): First date of the range
+            end_date (date): Last date of the range (inclusive)
+        
+        Returns:
+            Dict mapping each date in the range to its daily statistics
+        """
+        try:
+            with self._connect() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute("""
+                    SELECT date, total_entries, total_exits, peak_count, peak_time,
+                           avg_count, first_entry, last_exit
+                    FROM daily_summary
+                    WHERE date BETWEEN ? AND ?
+                """, (start_date, end_date))
+                
+                stats = {}
+                for row in cursor.fetchall():
+                    day = date.fromisoformat(str(row[0]))
+                    stats[day] = {
+                        "date": day,
+                        "total_entries": row[1],
+                        "total_exits": row[2],
+                        "peak_count": row[3],
+                        "peak_time": row[4],
+                        "avg_count": row[5],
+                        "first_entry": row[6],
+                        "last_exit": row[7]
+                    }
+                
+                days = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
+                if all(day in stats for day in days):
+                    return stats
+                
+                # Calculate the remaining days from the events table
+                cursor.execute("""
+                    SELECT 
+                        DATE(timestamp) as day,
+                        SUM(CASE WHEN event_type = 'entry' THEN 1 ELSE 0 END) as entries,
+                        SUM(CASE WHEN event_type = 'exit' THEN 1 ELSE 0 END) as exits,
+                        MAX(count_inside) as peak_count
+                    FROM events
+                    WHERE DATE(timestamp) BETWEEN ? AND ?
+                    GROUP BY DATE(timestamp)
+                """, (start_date, end_date))
+                
+                from_events = {date.fromisoformat(row[0]): row[1:] for row in cursor.fetchall()}
+                for day in days:
+                    if day not in stats:
+                        entries, exits, peak_count = from_events.get(day, (0, 0, 0))
+                        stats[day] = {
+                            "date": day,
+                            "total_entries": entries or 0,
+                            "total_exits": exits or 0,
+                            "peak_count": peak_count or 0,
+                            "peak_time": None,
+                            "avg_count": 0,
+                            "first_entry": None,
+                            "last_exit": None
+                        }
+                
+                return stats
+                
+        except Exception as e:
+            log_database_operation(self.logger, f"Get daily stats for {start_date} to {end_date}", False, str(e))
+            return {}
+    
     def get_events_by_date_range(self, start_date: date, end_date: date = None) -> List[Dict]:
         """
         Get events within a date range.
@@ -292,7 +476,7 @@ class DatabaseManager:
             end_date = start_date
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -367,7 +551,7 @@ class DatabaseManager:
             target_date = date.today()
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -408,7 +592,7 @@ class DatabaseManager:
             end_date = start_date
         
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 query = """
                     SELECT timestamp, event_type, person_id, count_inside,
                            total_entered, total_exited, confidence
@@ -429,59 +613,62 @@ class DatabaseManager:
     def _update_statistics(self, event_type: str, count_inside: int):
         """Update daily and hourly statistics tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                current_time = datetime.now()
-                current_date = current_time.date()
-                current_hour = current_time.hour
-                
-                # Update daily summary
-                if event_type in ['entry', 'exit']:
-                    cursor.execute("""
-                        INSERT OR IGNORE INTO daily_summary (date) VALUES (?)
-                    """, (current_date,))
-                    
-                    if event_type == 'entry':
-                        cursor.execute("""
-                            UPDATE daily_summary 
-                            SET total_entries = total_entries + 1,
-                                peak_count = MAX(peak_count, ?),
-                                first_entry = COALESCE(first_entry, ?)
-                            WHERE date = ?
-                        """, (count_inside, current_time, current_date))
-                    
-                    elif event_type == 'exit':
-                        cursor.execute("""
-                            UPDATE daily_summary 
-                            SET total_exits = total_exits + 1,
-                                last_exit = ?
-                            WHERE date = ?
-                        """, (current_time, current_date))
-                
-                # Update hourly stats
-                cursor.execute("""
-                    INSERT OR REPLACE INTO hourly_stats 
-                    (date, hour, entries, exits, peak_count)
-                    VALUES (?, ?, 
-                            COALESCE((SELECT entries FROM hourly_stats WHERE date=? AND hour=?), 0) + ?,
-                            COALESCE((SELECT exits FROM hourly_stats WHERE date=? AND hour=?), 0) + ?,
-                            MAX(COALESCE((SELECT peak_count FROM hourly_stats WHERE date=? AND hour=?), 0), ?))
-                """, (
-                    current_date, current_hour,
-                    current_date, current_hour, 1 if event_type == 'entry' else 0,
-                    current_date, current_hour, 1 if event_type == 'exit' else 0,
-                    current_date, current_hour, count_inside
-                ))
-                
+                self._apply_statistics(cursor, event_type, count_inside, datetime.now())
                 conn.commit()
                 
         except Exception as e:
             self.logger.error(f"Error updating statistics: {e}")
     
+    def _apply_statistics(self, cursor: sqlite3.Cursor, event_type: str, count_inside: int,
+                          current_time: datetime):
+        """Apply one event to the daily and hourly statistics tables on an open cursor."""
+        current_date = current_time.date()
+        current_hour = current_time.hour
+        
+        # Update daily summary
+        if event_type in ['entry', 'exit']:
+            cursor.execute("""
+                INSERT OR IGNORE INTO daily_summary (date) VALUES (?)
+            """, (current_date,))
+            
+            if event_type == 'entry':
+                cursor.execute("""
+                    UPDATE daily_summary 
+                    SET total_entries = total_entries + 1,
+                        peak_count = MAX(peak_count, ?),
+                        first_entry = COALESCE(first_entry, ?)
+                    WHERE date = ?
+                """, (count_inside, current_time, current_date))
+            
+            elif event_type == 'exit':
+                cursor.execute("""
+                    UPDATE daily_summary 
+                    SET total_exits = total_exits + 1,
+                        last_exit = ?
+                    WHERE date = ?
+                """, (current_time, current_date))
+        
+        # Update hourly stats
+        cursor.execute("""
+            INSERT OR REPLACE INTO hourly_stats 
+            (date, hour, entries, exits, peak_count)
+            VALUES (?, ?, 
+                    COALESCE((SELECT entries FROM hourly_stats WHERE date=? AND hour=?), 0) + ?,
+                    COALESCE((SELECT exits FROM hourly_stats WHERE date=? AND hour=?), 0) + ?,
+                    MAX(COALESCE((SELECT peak_count FROM hourly_stats WHERE date=? AND hour=?), 0), ?))
+        """, (
+            current_date, current_hour,
+            current_date, current_hour, 1 if event_type == 'entry' else 0,
+            current_date, current_hour, 1 if event_type == 'exit' else 0,
+            current_date, current_hour, count_inside
+        ))
+    
     def _calculate_daily_stats(self, target_date: date) -> Dict[str, Any]:
         """Calculate daily statistics from events table."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
                 
                 # Count entries and exits
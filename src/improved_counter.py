@@ -95,9 +95,10 @@ class ImprovedPeopleCounter:
             # Add current position to trajectory
             self.object_trajectories[object_id].append((centroid[0], centroid[1], current_time))
             
-            # Keep only recent trajectory points
-            if len(self.object_trajectories[object_id]) > self.trajectory_length:
-                self.object_trajectories[object_id] = self.object_trajectories[object_id][-self.trajectory_length:]
+            # Keep only recent trajectory points (truncated in place, no new list)
+            trajectory = self.object_trajectories[object_id]
+            if len(trajectory) > self.trajectory_length:
+                del trajectory[:-self.trajectory_length]
             
             # Check for crossing if we have enough trajectory points
             traj_len = len(self.object_trajectories[object_id])
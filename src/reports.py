@@ -5,6 +5,8 @@ Generates daily/weekly/monthly crowd summaries and exports to CSV/Excel formats.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to file, possibly from worker threads
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime, date, timedelta
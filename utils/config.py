@@ -23,6 +23,7 @@ class Config:
             config_file (str): Path to JSON configuration file (optional)
         """
         self.config_file = config_file
+        self._version = 0
         self._load_defaults()
         
         if config_file and os.path.exists(config_file):
@@ -150,6 +151,8 @@ class Config:
             for key, value in config_data.items():
                 if hasattr(self, key):
                     setattr(self, key, value)
+            
+            self.mark_changed()
                     
         except Exception as e:
             print(f"Warning: Could not load config file {config_file}: {e}")
@@ -191,6 +194,7 @@ class Config:
         """
         self.COUNTING_LINE["start"] = start_percent
         self.COUNTING_LINE["end"] = end_percent
+        self.mark_changed()
     
     def update_crowd_limit(self, new_limit: int):
         """
@@ -201,6 +205,20 @@ class Config:
         """
         self.CROWD_LIMIT = new_limit
         self.WARNING_THRESHOLD = int(new_limit * 0.8)
+        self.mark_changed()
+    
+    def mark_changed(self):
+        """Record that settings were modified so cached views get rebuilt."""
+        self._version += 1
+    
+    def get_version(self) -> int:
+        """
+        Get the configuration version counter.
+        
+        Returns:
+            int: Number that increases every time settings are modified
+        """
+        return self._version
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -225,7 +243,12 @@ config = Config()
 
 # Convenience functions
 def get_config() -> Config:
-    """Get the global configuration instance."""
+    """
+    Get the global configuration instance.
+    
+    The .env file and defaults are parsed once at import; repeated calls
+    return the same object until reload_config() replaces it.
+    """
     return config
 
 def reload_config(config_file: str = None):
@@ -74,7 +74,7 @@ def log_detection_event(logger: logging.Logger, event_type: str, person_id: int,
         person_id (int): ID of the person
         count (int): Current count after event
     """
-    logger.info(f"Detection Event - Type: {event_type}, Person ID: {person_id}, New Count: {count}")
+    logger.info("Detection Event - Type: %s, Person ID: %s, New Count: %s", event_type, person_id, count)
 
 
 def log_alert(logger: logging.Logger, alert_type: str, current_count: int, limit: int):